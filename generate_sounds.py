@@ -40,6 +40,13 @@ CHORUS_VOICES = [
     (+11.0, 0.08), (-11.0, 0.08),  # wide pair  — movement / "alive" feel
 ]
 
+# One-cycle sine wavetable (4096 entries, 16 KiB — stays L1-resident).
+# Oscillators read it through a per-voice phase accumulator instead of
+# evaluating sin() per sample; nearest-entry lookup keeps the error
+# below -60 dB, well under the audible floor of a short UI cue.
+WAVETABLE_SIZE = 4096
+SINE_TABLE = np.sin(2 * np.pi * np.arange(WAVETABLE_SIZE) / WAVETABLE_SIZE).astype(np.float32)
+
 
 def rich_chorus(
     freq: float,
@@ -62,32 +69,37 @@ def rich_chorus(
     sub_gain    : level of the sub-octave (freq/2) bass layer
     """
     n = int(SR * duration)
-    t = np.linspace(0, duration, n, endpoint=False)
-
-    # --- 7 chorus voices ---
-    wave = np.zeros(n)
-    for cents, gain in CHORUS_VOICES:
-        f = freq * (2 ** (cents / 1200.0))
-        wave += gain * np.sin(2 * np.pi * f * t)
-
-    # --- Sub-octave bass layer ---
-    wave += sub_gain * np.sin(2 * np.pi * (freq * 0.5) * t)
-
-    # --- Envelope ---
+    t = np.linspace(0, duration, n, endpoint=False, dtype=np.float32)
+
+    # --- 7 chorus voices + sub-octave bass layer (freq/2) ---
+    # One (voices, n) wavetable-index matrix from each voice's phase
+    # (in table entries), a single table gather, then a gain-weighted sum
+    # over the voice axis.
+    freqs = np.array([freq * (2 ** (cents / 1200.0)) for cents, _ in CHORUS_VOICES]
+                     + [freq * 0.5])
+    gains = np.array([gain for _, gain in CHORUS_VOICES] + [sub_gain], dtype=np.float32)
+    phase = np.multiply.outer(freqs * WAVETABLE_SIZE, t)
+    phase += 0.5  # round to the nearest table entry
+    idx = phase.astype(np.int64) & (WAVETABLE_SIZE - 1)
+    wave = gains @ SINE_TABLE[idx]
+
+    # --- Envelope (built in a single buffer, applied in one multiply) ---
     tau = duration * decay_ratio
-    env = np.exp(-t / tau)
+    env = t * (-1.0 / tau)
+    np.exp(env, out=env)
 
     # Ease-in attack (x^2 curve — smoother than linear)
     a_n = int(attack_ms / 1000.0 * SR)
-    ramp = np.linspace(0, 1, a_n) ** 2
+    ramp = np.linspace(0, 1, a_n, dtype=np.float32)
+    np.square(ramp, out=ramp)
     env[:a_n] *= ramp
 
     wave *= env
 
     # Normalise to target amplitude
-    peak = np.max(np.abs(wave))
+    peak = max(wave.max(), -wave.min())
     if peak > 0:
-        wave = wave / peak * amplitude
+        wave *= amplitude / peak
     return wave
 
 
@@ -105,31 +117,41 @@ def add_reverb(signal: np.ndarray, wet: float = 0.28) -> np.ndarray:
         (91,  0.20),
         (130, 0.11),
     ]
-    rev = np.zeros(len(signal))
+    # Fold the dry path (identity) and the wet taps into one sparse impulse
+    # response and apply it with a single FFT-domain convolution.
+    ir = np.zeros(int(taps[-1][0] / 1000.0 * SR) + 1, dtype=np.float32)
+    ir[0] = 1.0
     for delay_ms, gain in taps:
-        d = int(delay_ms / 1000.0 * SR)
-        if d < len(signal):
-            rev[d:] += gain * signal[: len(signal) - d]
-    return signal + wet * rev
+        ir[int(delay_ms / 1000.0 * SR)] = wet * gain
+
+    n = len(signal)
+    size = n + len(ir) - 1
+    spectrum = np.fft.rfft(signal, size) * np.fft.rfft(ir, size)
+    return np.fft.irfft(spectrum, size)[:n]
 
 
 def true_stereo(a: np.ndarray, b: np.ndarray,
                 pan_a: float = -0.25, pan_b: float = 0.25) -> np.ndarray:
     """Equal-power stereo panning: a → pan_a, b → pan_b."""
-    n = max(len(a), len(b))
-    a = np.pad(a, (0, n - len(a)))
-    b = np.pad(b, (0, n - len(b)))
-    left  = (a * np.cos(np.pi / 4 * (1 - pan_a))
-             + b * np.cos(np.pi / 4 * (1 - pan_b)))
-    right = (a * np.sin(np.pi / 4 * (1 + pan_a))
-             + b * np.sin(np.pi / 4 * (1 + pan_b)))
-    return np.stack([left, right], axis=1)
+    # (left, right) gains per source, computed once
+    gains_a = np.array([np.cos(np.pi / 4 * (1 - pan_a)), np.sin(np.pi / 4 * (1 + pan_a))],
+                       dtype=np.float32)
+    gains_b = np.array([np.cos(np.pi / 4 * (1 - pan_b)), np.sin(np.pi / 4 * (1 + pan_b))],
+                       dtype=np.float32)
+
+    # Mix straight into the (n, 2) output — the shorter source is implicitly
+    # zero-padded, so no padded copies or left/right temporaries are needed.
+    out = np.zeros((max(len(a), len(b)), 2), dtype=np.float32)
+    out[: len(a)] = np.multiply.outer(a, gains_a)
+    out[: len(b)] += np.multiply.outer(b, gains_b)
+    return out
 
 
 def normalize(stereo: np.ndarray, headroom_db: float = -9.0) -> np.ndarray:
-    peak = np.max(np.abs(stereo))
+    """Scale ``stereo`` in place so its peak sits at ``headroom_db`` dBFS."""
+    peak = max(stereo.max(), -stereo.min())
     if peak > 0:
-        stereo = stereo * (10 ** (headroom_db / 20.0) / peak)
+        stereo *= 10 ** (headroom_db / 20.0) / peak
     return stereo
 
 
@@ -150,7 +172,8 @@ fs4 = rich_chorus(369.99, fs4_dur, amplitude=0.56,
                   attack_ms=40, decay_ratio=0.56, sub_gain=0.13)
 
 total_n   = int(DUR_START * SR)
-fs4_pad   = np.pad(fs4, (fs4_onset, total_n - fs4_onset - len(fs4)))[:total_n]
+fs4_pad   = np.zeros(total_n, dtype=np.float32)
+fs4_pad[fs4_onset:fs4_onset + len(fs4)] = fs4[: total_n - fs4_onset]
 
 # Reverb applied per-note before mixing → richer spatial image
 d4_wet  = add_reverb(d4,      wet=0.26)
@@ -1,13 +1,13 @@
 """Mic capture, Voice Activity Detection, gain normalization, and WAV encoding."""
 
-import io
 import logging
+import math
+import struct
 import threading
 from typing import Optional
 
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +15,19 @@ logger = logging.getLogger(__name__)
 def list_microphones() -> list[dict]:
     """Return a list of available microphones with their info."""
     devices = sd.query_devices()
-    mics = []
-    for i, device in enumerate(devices):
-        if device['max_input_channels'] > 0:
-            mics.append({
-                'index': i,
-                'name': device['name'],
-                'channels': device['max_input_channels'],
-                'is_default': i == sd.default.device[0] if isinstance(sd.default.device, tuple) else i == sd.default.device,
-            })
-    return mics
+    # Resolved once: each sd.default.device[0] read is a PortAudio call, and
+    # the value is an (input, output) pair object, not a tuple.
+    default_input = sd.default.device[0]
+    return [
+        {
+            'index': i,
+            'name': device['name'],
+            'channels': device['max_input_channels'],
+            'is_default': i == default_input,
+        }
+        for i, device in enumerate(devices)
+        if device['max_input_channels'] > 0
+    ]
 
 
 def get_default_microphone_index() -> int:
@@ -40,7 +43,15 @@ def get_default_microphone_index() -> int:
 _vad_model = None
 _vad_lock = threading.Lock()
 
+
 TARGET_DBFS = -20.0  # Target RMS level for gain normalization
+GAIN_TOLERANCE_DB = 1.0  # Smaller corrections are inaudible; leave the audio untouched
+
+_VAD_WARMUP_SAMPLES = 4096  # 8 chunks of 512 at 16 kHz
+_VAD_WARMUP_RUNS = 2
+
+# RIFF/WAVE header: RIFF chunk, 16-byte PCM fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
 
 def _load_vad():
@@ -54,8 +65,24 @@ def _load_vad():
             return
 
         logger.info("Loading Silero VAD model...")
+        import torch
         from silero_vad import load_silero_vad
-        _vad_model = load_silero_vad()
+        # Each VAD step is a 512-sample chunk, far too small to split across
+        # cores; an intra-op pool only spins threads that compete with the
+        # audio callback and hotkey dispatch. Torch releases the GIL inside
+        # the forward pass, so one native thread doesn't block Python code.
+        torch.set_num_threads(1)
+        model = load_silero_vad()  # already a TorchScript module
+        model.eval()
+
+        # TorchScript's profiling executor specializes the graph over the
+        # first few calls — pay that here rather than on the first recording.
+        warmup = torch.zeros(_VAD_WARMUP_SAMPLES)
+        with torch.inference_mode():
+            for _ in range(_VAD_WARMUP_RUNS):
+                model.audio_forward(warmup, 16000)
+
+        _vad_model = model
         logger.info("Silero VAD model loaded")
 
 
@@ -64,12 +91,21 @@ def is_vad_loaded() -> bool:
     return _vad_model is not None
 
 
+def _rms(audio: np.ndarray) -> float:
+    """Root-mean-square of a 1D signal, via a single dot product (no squared temp array)."""
+    return math.sqrt(float(np.dot(audio, audio)) / len(audio))
+
+
 class AudioRecorder:
     """Records audio from a specified microphone into a growing buffer."""
 
+    INITIAL_BUFFER_SECONDS = 30  # capacity doubles whenever a recording outgrows it
+    LEVEL_WINDOW_SECONDS = 0.1  # span of recent audio used for current_level
+
     def __init__(self, sample_rate: int = 16000, device: Optional[int] = None) -> None:
         self.sample_rate = sample_rate
-        self._chunks: list[np.ndarray] = []
+        self._buf = np.empty(0, dtype=np.float32)
+        self._write = 0
         self._stream: Optional[sd.InputStream] = None
         self._recording = threading.Event()
 
@@ -78,6 +114,7 @@ class AudioRecorder:
         sd._initialize()
 
         self.device = self._validate_device(device)
+        self.device_name = self._device_name(self.device)
 
     @staticmethod
     def _validate_device(device: Optional[int]) -> Optional[int]:
@@ -96,6 +133,20 @@ class AudioRecorder:
             logger.warning("Device index %d not found, falling back to default", device)
         return None
 
+    @staticmethod
+    def _device_name(device: Optional[int]) -> str:
+        """Name of ``device``, or of the default input when None.
+
+        Resolved once per recorder: PortAudio's device list is only
+        refreshed in __init__, so the name cannot change under it.
+        """
+        try:
+            if device is None:
+                return sd.query_devices(kind='input')['name']
+            return sd.query_devices(device)['name']
+        except Exception:
+            return "unknown"
+
     def start(self) -> None:
         """Start recording audio."""
         # Defensive cleanup: close any lingering stream from a prior start()
@@ -107,7 +158,13 @@ class AudioRecorder:
                 pass
             self._stream = None
 
-        self._chunks.clear()
+        # Fresh buffer per recording: the previous stop() result is a view
+        # into the old one and may still be in the processing pipeline.
+        # Reset the write index first: current_level reads _buf and _write
+        # without a lock and must never pair the stale index with the new,
+        # uninitialized buffer.
+        self._write = 0
+        self._buf = np.empty(self.sample_rate * self.INITIAL_BUFFER_SECONDS, dtype=np.float32)
         self._recording.set()
         self._stream = sd.InputStream(
             device=self.device,
@@ -117,15 +174,19 @@ class AudioRecorder:
             callback=self._audio_callback,
         )
         self._stream.start()
-        device_info = sd.query_devices(self.device)
-        device_name = device_info['name'] if isinstance(device_info, dict) else "unknown"
-        logger.info("Recording started on device: %s (index: %s)", device_name, self.device)
+        logger.info("Recording started on device: %s (index: %s)", self.device_name, self.device)
 
     def _audio_callback(self, indata, frames, time_info, status):
         if status:
             logger.warning("Audio callback status: %s", status)
         if self._recording.is_set():
-            self._chunks.append(indata.copy())
+            end = self._write + len(indata)
+            if end > len(self._buf):
+                grown = np.empty(max(end, 2 * len(self._buf)), dtype=np.float32)
+                grown[: self._write] = self._buf[: self._write]
+                self._buf = grown
+            self._buf[self._write : end] = indata[:, 0]
+            self._write = end
 
     def stop(self) -> np.ndarray:
         """Stop recording and return the raw audio as a 1D float32 array."""
@@ -134,21 +195,22 @@ class AudioRecorder:
             self._stream.stop()
             self._stream.close()
             self._stream = None
-        logger.info("Recording stopped, %d chunks captured", len(self._chunks))
-
-        if not self._chunks:
-            return np.array([], dtype=np.float32)
-
-        audio = np.concatenate(self._chunks, axis=0).flatten()
-        return audio
+        logger.info("Recording stopped, %d samples captured", self._write)
+        return self._buf[: self._write]
 
     @property
     def current_level(self) -> float:
-        """Return RMS level of the most recent audio (0.0–1.0)."""
-        if not self._chunks:
+        """Return RMS level of the most recent audio (0.0–1.0).
+
+        Polled from the UI thread with no lock: the audio callback only ever
+        publishes a buffer before advancing the index into it, so any
+        (buffer, index) pair read here covers samples that were written.
+        """
+        buf, end = self._buf, self._write
+        if end == 0:
             return 0.0
-        recent = np.concatenate(self._chunks[-4:])
-        rms = float(np.sqrt(np.mean(recent ** 2)))
+        recent = buf[max(0, end - int(self.sample_rate * self.LEVEL_WINDOW_SECONDS)) : end]
+        rms = _rms(recent)
         return min(rms * 12, 1.0)  # scale so normal speech hits ~0.5–0.8
 
     def cancel(self) -> None:
@@ -158,10 +220,28 @@ class AudioRecorder:
             self._stream.stop()
             self._stream.close()
             self._stream = None
-        self._chunks.clear()
+        self._write = 0
         logger.info("Recording cancelled")
 
 
+def _merge_intervals(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Merge sorted [start, end) intervals that overlap or touch, in one vectorized pass."""
+    running_end = np.maximum.accumulate(ends)
+    breaks = starts[1:] > running_end[:-1]
+    return (
+        starts[np.concatenate(([True], breaks))],
+        running_end[np.concatenate((breaks, [True]))],
+    )
+
+
+def _interval_mask(starts: np.ndarray, ends: np.ndarray, length: int) -> np.ndarray:
+    """Boolean mask selecting the samples covered by disjoint [start, end) intervals."""
+    edges = np.zeros(length + 1, dtype=np.int8)
+    edges[starts] = 1
+    edges[ends] = -1
+    return np.cumsum(edges[:-1], dtype=np.int8) > 0
+
+
 def trim_silence(audio: np.ndarray, sample_rate: int = 16000, threshold: float = 0.3) -> np.ndarray:
     """Use Silero VAD to trim silence from audio. Returns trimmed audio."""
     if len(audio) == 0:
@@ -171,39 +251,28 @@ def trim_silence(audio: np.ndarray, sample_rate: int = 16000, threshold: float =
 
     import torch
 
-    # Silero VAD expects 16kHz mono, chunks of 512 samples
+    # Silero VAD expects 16kHz mono, chunks of 512 samples. audio_forward
+    # resets the model state and runs the whole chunk loop inside
+    # TorchScript, so there is one dispatch per recording, not per chunk.
     chunk_size = 512
-    speech_chunks = []
-    has_speech = False
-
-    _vad_model.reset_states()
-
-    for i in range(0, len(audio) - chunk_size + 1, chunk_size):
-        chunk = audio[i : i + chunk_size]
-        tensor = torch.from_numpy(chunk).float()
-        prob = _vad_model(tensor, sample_rate).item()
-        if prob >= threshold:
-            has_speech = True
-            # Include some context around speech
-            start = max(0, i - chunk_size)
-            end = min(len(audio), i + chunk_size * 2)
-            speech_chunks.append((start, end))
-
-    if not has_speech:
+    n_chunks = len(audio) // chunk_size
+    probs = np.empty(0, dtype=np.float32)
+    if n_chunks:
+        tensor = torch.from_numpy(audio[: n_chunks * chunk_size]).float()
+        with torch.inference_mode():
+            probs = _vad_model.audio_forward(tensor, sample_rate).numpy().ravel()
+
+    speech_at = np.flatnonzero(probs >= threshold) * chunk_size
+    if len(speech_at) == 0:
         logger.info("No speech detected by VAD")
         return np.array([], dtype=np.float32)
 
-    # Merge overlapping regions
-    merged = [speech_chunks[0]]
-    for start, end in speech_chunks[1:]:
-        if start <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-        else:
-            merged.append((start, end))
+    # Include some context around speech
+    starts = np.maximum(speech_at - chunk_size, 0)
+    ends = np.minimum(speech_at + chunk_size * 2, len(audio))
 
-    # Extract and concatenate speech regions
-    parts = [audio[s:e] for s, e in merged]
-    trimmed = np.concatenate(parts)
+    # Merge overlapping regions, then extract them in a single gather
+    trimmed = audio[_interval_mask(*_merge_intervals(starts, ends), len(audio))]
 
     ratio = len(trimmed) / len(audio)
     logger.info("VAD trimmed audio: %.1f%% speech (%.2fs → %.2fs)",
@@ -211,35 +280,89 @@ def trim_silence(audio: np.ndarray, sample_rate: int = 16000, threshold: float =
     return trimmed
 
 
-def normalize_gain(audio: np.ndarray, target_dbfs: float = TARGET_DBFS) -> np.ndarray:
-    """RMS gain normalization to target dBFS level. Helps with whisper-level audio."""
+def normalize_gain(
+    audio: np.ndarray, target_dbfs: float = TARGET_DBFS, inplace: bool = False
+) -> np.ndarray:
+    """RMS gain normalization to target dBFS level. Helps with whisper-level audio.
+
+    Audio already within ``GAIN_TOLERANCE_DB`` of the target is returned as-is.
+    With ``inplace=True`` a writable ``audio`` is scaled and clipped in its own
+    buffer instead of a new array.
+    """
     if len(audio) == 0:
         return audio
 
-    rms = np.sqrt(np.mean(audio ** 2))
+    rms = _rms(audio)
     if rms < 1e-10:
         logger.warning("Audio is essentially silent, skipping normalization")
         return audio
 
-    current_dbfs = 20 * np.log10(rms)
+    current_dbfs = 20 * math.log10(rms)
     gain_db = target_dbfs - current_dbfs
+    if abs(gain_db) < GAIN_TOLERANCE_DB:
+        logger.info("Gain normalization skipped: %.1f dBFS is within %.1f dB of target",
+                    current_dbfs, GAIN_TOLERANCE_DB)
+        return audio
     gain_linear = 10 ** (gain_db / 20)
 
-    normalized = audio * gain_linear
+    if inplace and audio.flags.writeable:
+        normalized = audio
+        normalized *= gain_linear
+    else:
+        normalized = audio * gain_linear
 
     # Clip to prevent distortion
-    normalized = np.clip(normalized, -1.0, 1.0)
+    np.clip(normalized, -1.0, 1.0, out=normalized)
     logger.info("Gain normalization: %.1f dBFS → %.1f dBFS (gain: %.1f dB)",
                 current_dbfs, target_dbfs, gain_db)
     return normalized
 
 
+def _to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Scale, round and clip float audio in [-1, 1] to little-endian int16.
+
+    Clipping and rounding reuse the scaled float buffer, so the only
+    allocations are that buffer and the int16 result.
+    """
+    pcm = audio * 32767.0
+    np.clip(pcm, -32768, 32767, out=pcm)
+    np.rint(pcm, out=pcm)
+    return pcm.astype("<i2")
+
+
+def _wav_header(data_size: int, sample_rate: int) -> bytes:
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,  # PCM, mono, 16-bit
+        b"data", data_size,
+    )
+
+
 def encode_wav(audio: np.ndarray, sample_rate: int = 16000) -> bytes:
-    """Encode float32 PCM audio to WAV bytes."""
-    buf = io.BytesIO()
-    sf.write(buf, audio, sample_rate, format="WAV", subtype="PCM_16")
-    buf.seek(0)
-    return buf.read()
+    """Encode mono float32 PCM audio to 16-bit WAV bytes.
+
+    The 44-byte RIFF header is packed directly and joined with the int16
+    samples, so the payload is copied once into the returned bytes.
+    """
+    pcm = _to_pcm16(audio)
+    return b"".join((_wav_header(pcm.nbytes, sample_rate), memoryview(pcm)))
+
+
+def write_wav(path, audio: np.ndarray, sample_rate: int = 16000) -> None:
+    """Write ``audio`` to ``path`` as a 16-bit WAV, same format as ``encode_wav``.
+
+    The int16 samples go straight from their array to the file, with no
+    intermediate bytes object holding the whole payload.
+    """
+    pcm = _to_pcm16(audio)
+    with open(path, "wb") as f:
+        f.write(_wav_header(pcm.nbytes, sample_rate))
+        f.write(memoryview(pcm))
+
+
+def wav_duration(wav_bytes: bytes, sample_rate: int = 16000) -> float:
+    """Duration in seconds of mono 16-bit WAV bytes produced by ``encode_wav``."""
+    return (len(wav_bytes) - _WAV_HEADER.size) / (2 * sample_rate)
 
 
 def process_audio(
@@ -250,11 +373,12 @@ def process_audio(
     """Full audio pipeline: gain normalize → VAD trim → encode WAV.
 
     Normalization runs first so whisper-level audio is amplified before
-    VAD attempts to detect speech.
+    VAD attempts to detect speech. It is applied in place, so ``audio`` is
+    consumed: callers that need the raw recording must use it beforehand.
 
     Returns WAV bytes, or None if no speech detected.
     """
-    normalized = normalize_gain(audio)
+    normalized = normalize_gain(audio, inplace=True)
     trimmed = trim_silence(normalized, sample_rate, vad_threshold)
     if len(trimmed) == 0:
         return None
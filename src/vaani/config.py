@@ -17,6 +17,11 @@ MODES = ["minimal", "professional", "casual", "code", "funny"]
 CONFIG_FILE = VAANI_DIR / "config.yaml"
 KEYRING_SERVICE = "vaani"
 
+# libyaml-backed loader/dumper when PyYAML was built with it (the wheels are);
+# same safe subset as yaml.safe_load, parsed in C.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class VaaniConfig(BaseSettings):
     """Vaani configuration, loaded from ~/.vaani/config.yaml."""
@@ -27,6 +32,7 @@ class VaaniConfig(BaseSettings):
     # Audio
     sample_rate: int = 16000
     vad_threshold: float = 0.05
+    silence_peak_threshold: float = 0.005  # peak below this skips VAD entirely
     max_recording_seconds: int = 600  # 10 minutes
     microphone_device: Optional[int] = None  # None = system default
 
@@ -68,7 +74,7 @@ def load_config() -> VaaniConfig:
     ensure_vaani_dir()
     if CONFIG_FILE.exists():
         try:
-            data = yaml.safe_load(CONFIG_FILE.read_text()) or {}
+            data = yaml.load(CONFIG_FILE.read_text(), Loader=_YAML_LOADER) or {}
             # Migrate removed/renamed modes
             if data.get("active_mode") in ("bullets", "cleanup"):
                 data["active_mode"] = "minimal"
@@ -78,11 +84,25 @@ def load_config() -> VaaniConfig:
     return VaaniConfig()
 
 
+# Bumped by every save_config() in this process, so the running app picks up
+# edits from the settings window or menu bar without polling the file.
+_save_generation = 0
+
+
 def save_config(config: VaaniConfig) -> None:
     """Save config to YAML file."""
+    global _save_generation
     ensure_vaani_dir()
     data = config.model_dump()
-    CONFIG_FILE.write_text(yaml.dump(data, default_flow_style=False, sort_keys=False))
+    CONFIG_FILE.write_text(yaml.dump(
+        data, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+    ))
+    _save_generation += 1
+
+
+def save_generation() -> int:
+    """Number of save_config() calls made in this process so far."""
+    return _save_generation
 
 
 # --- API Key Management via Keyring ---
@@ -109,7 +129,7 @@ def _get_bundled_keys() -> dict:
     for path in bundled_paths:
         if path.exists():
             try:
-                data = yaml.safe_load(path.read_text()) or {}
+                data = yaml.load(path.read_text(), Loader=_YAML_LOADER) or {}
                 return data
             except Exception:
                 logger.debug("Failed to load bundled keys from %s", path)
@@ -2,6 +2,7 @@
 
 import logging
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -29,8 +30,36 @@ def _load_prompt_file(relative_path: str) -> Optional[str]:
     return None
 
 
+def _prompt_stamp(mode: str) -> tuple:
+    """(path, mtime, size) of every prompt file the mode's prompt may read.
+
+    A few stat() calls per dictation; any edit, new override or deleted file
+    changes the stamp and with it the cache key below.
+    """
+    stamp = []
+    for relative_path in ("system.txt", "context.txt", f"modes/{mode}.txt"):
+        for base in (_USER_PROMPTS, _BUNDLED_PROMPTS):
+            path = base / relative_path
+            try:
+                st = path.stat()
+            except OSError:
+                stamp.append((str(path), None, None))
+            else:
+                stamp.append((str(path), st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
 def _build_system_prompt(mode: str) -> str:
-    """Assemble system prompt from: system.txt + context.txt + modes/{mode}.txt."""
+    """Assemble system prompt from: system.txt + context.txt + modes/{mode}.txt.
+
+    Cached per mode and prompt-file stamp, so repeat dictations skip the file
+    reads while edits to ~/.vaani/prompts apply on the next dictation.
+    """
+    return _assemble_system_prompt(mode, _prompt_stamp(mode))
+
+
+@lru_cache(maxsize=8)
+def _assemble_system_prompt(mode: str, stamp: tuple) -> str:
     parts = []
 
     system = _load_prompt_file("system.txt")
@@ -56,6 +85,12 @@ def _build_system_prompt(mode: str) -> str:
     return "\n\n".join(parts)
 
 
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> "anthropic.Anthropic":
+    """Shared client per API key, so its connection pool and TLS sessions are reused."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
 def enhance(
     transcription: str,
     mode: str = "minimal",
@@ -84,7 +119,7 @@ def enhance(
         return transcription
 
     system_prompt = _build_system_prompt(mode)
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_client(api_key)
 
     start = time.monotonic()
     result_parts = []
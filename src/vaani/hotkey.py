@@ -7,6 +7,8 @@ delivers events on the main thread and never touches the Text Services Manager.
 """
 
 import logging
+import queue
+import threading
 from typing import Callable, Optional
 
 try:
@@ -18,20 +20,21 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_HOTKEY = "<alt>"
 
-# NSEvent modifier flag masks (NSEventModifierFlag*)
+# NSEvent modifier flag masks (NSEventModifierFlag*).
+# Keyed by bare name; _parse_hotkey strips pynput-style "<...>" brackets.
 _MODIFIER_FLAGS = {
-    "alt": 1 << 19, "<alt>": 1 << 19,
-    "cmd": 1 << 20, "<cmd>": 1 << 20,
-    "shift": 1 << 17, "<shift>": 1 << 17,
-    "ctrl": 1 << 18, "<ctrl>": 1 << 18,
+    "alt": 1 << 19,
+    "cmd": 1 << 20,
+    "shift": 1 << 17,
+    "ctrl": 1 << 18,
 }
 
 # Special characters for non-modifier key combos
 _SPECIAL_CHARS = {
-    "space": " ", "<space>": " ",
-    "esc": "\x1b", "<esc>": "\x1b",
-    "tab": "\t", "<tab>": "\t",
-    "enter": "\r", "<enter>": "\r",
+    "space": " ",
+    "esc": "\x1b",
+    "tab": "\t",
+    "enter": "\r",
 }
 
 # NSEvent type constants
@@ -58,7 +61,9 @@ class HotkeyListener:
     - Press Escape during recording → on_cancel callback
 
     start() must be called from the main thread (before or during the NSRunLoop).
-    Event callbacks are delivered on the main thread — no TSM thread-safety issues.
+    Events are matched on the main thread — no TSM thread-safety issues — but
+    the user callbacks run in order on a dedicated dispatch thread, so a slow
+    callback (e.g. waiting for prewarm) never stalls the run loop.
     """
 
     def __init__(
@@ -74,6 +79,8 @@ class HotkeyListener:
         self.on_cancel = on_cancel
         self._monitor = None
         self._hotkey_pressed = False
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
         self._modifier_flags, self._trigger_char = self._parse_hotkey(hotkey)
 
     @staticmethod
@@ -83,10 +90,11 @@ class HotkeyListener:
         trigger_char = None
         for part in hotkey_str.lower().split("+"):
             part = part.strip()
-            if part in _MODIFIER_FLAGS:
-                modifier_mask |= _MODIFIER_FLAGS[part]
-            elif part in _SPECIAL_CHARS:
-                trigger_char = _SPECIAL_CHARS[part]
+            name = part.strip("<>") or part  # "<cmd>" → "cmd"; keep a literal "<" or ">"
+            if name in _MODIFIER_FLAGS:
+                modifier_mask |= _MODIFIER_FLAGS[name]
+            elif name in _SPECIAL_CHARS:
+                trigger_char = _SPECIAL_CHARS[name]
             elif len(part) == 1:
                 trigger_char = part
             else:
@@ -95,53 +103,80 @@ class HotkeyListener:
 
     def start(self) -> None:
         """Register the global NSEvent monitor. Must be called from the main thread."""
+        self._worker = threading.Thread(
+            target=self._dispatch_loop, name="hotkey-dispatch", daemon=True
+        )
+        self._worker.start()
         self._monitor = _NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
             _MONITOR_MASK, self._handle_event
         )
         logger.info("Hotkey listener started: %s", self.hotkey)
 
     def stop(self) -> None:
-        """Remove the NSEvent monitor."""
+        """Remove the NSEvent monitor and let the dispatch thread drain and exit."""
         if self._monitor is not None:
             _NSEvent.removeMonitor_(self._monitor)
             self._monitor = None
             logger.info("Hotkey listener stopped")
+        if self._worker is not None:
+            self._events.put(None)  # sentinel: exit after already-queued callbacks
+            self._worker = None
+
+    def _dispatch_loop(self) -> None:
+        """Run queued callbacks in arrival order until the stop sentinel."""
+        while (op := self._events.get()) is not None:
+            self._dispatch(op)
+
+    def _dispatch(self, op: str) -> None:
+        callback = {"press": self.on_press, "release": self.on_release, "cancel": self.on_cancel}[op]
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception:
+            logger.exception("Hotkey %s callback failed", op)
+
+    def _emit(self, op: str) -> None:
+        """Hand a callback to the dispatch thread (inline if the listener isn't started)."""
+        if self._worker is None:
+            self._dispatch(op)
+        else:
+            self._events.put(op)
 
     def _handle_event(self, event) -> None:
         """Handle an NSEvent to detect hotkey press, release, and escape-cancel."""
         event_type = event.type()
-        modifiers = event.modifierFlags() & _MODIFIER_KEY_MASK
 
+        # Only read modifierFlags() on the event types that need it: every
+        # PyObjC message costs a bridge call, and ordinary typing delivers a
+        # KeyDown/KeyUp per keystroke.
         if self._trigger_char is None:
             # Modifier-only hotkey (e.g. "alt", "cmd")
             if event_type == _NSFlagsChanged:
+                modifiers = event.modifierFlags() & _MODIFIER_KEY_MASK
                 required_held = (modifiers & self._modifier_flags) == self._modifier_flags
                 if required_held and not self._hotkey_pressed:
                     self._hotkey_pressed = True
-                    if self.on_press:
-                        self.on_press()
+                    self._emit("press")
                 elif not required_held and self._hotkey_pressed:
                     self._hotkey_pressed = False
-                    if self.on_release:
-                        self.on_release()
+                    self._emit("release")
         else:
             # Combo hotkey with a non-modifier character (e.g. "<cmd>+<shift>+;")
             if event_type == _NSKeyDown:
                 char = (event.charactersIgnoringModifiers() or "").lower()
-                mods_ok = (modifiers & self._modifier_flags) == self._modifier_flags
-                if char == self._trigger_char and mods_ok and not self._hotkey_pressed:
-                    self._hotkey_pressed = True
-                    if self.on_press:
-                        self.on_press()
+                if char == self._trigger_char and not self._hotkey_pressed:
+                    modifiers = event.modifierFlags() & _MODIFIER_KEY_MASK
+                    if (modifiers & self._modifier_flags) == self._modifier_flags:
+                        self._hotkey_pressed = True
+                        self._emit("press")
             elif event_type == _NSKeyUp and self._hotkey_pressed:
                 char = (event.charactersIgnoringModifiers() or "").lower()
                 if char == self._trigger_char:
                     self._hotkey_pressed = False
-                    if self.on_release:
-                        self.on_release()
+                    self._emit("release")
 
         # Escape cancels an in-progress recording regardless of hotkey type
-        if event_type == _NSKeyDown and event.keyCode() == _ESC_KEYCODE and self._hotkey_pressed:
+        if self._hotkey_pressed and event_type == _NSKeyDown and event.keyCode() == _ESC_KEYCODE:
             self._hotkey_pressed = False
-            if self.on_cancel:
-                self.on_cancel()
+            self._emit("cancel")
@@ -1,11 +1,17 @@
 """Entry point: CLI commands and pipeline orchestration."""
 
+import atexit
+import fcntl
 import logging
 import logging.handlers
 import os
+import queue
+import signal
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 # macOS python.org installs ship without SSL root certs — urllib (used by
 # torch.hub) fails with CERTIFICATE_VERIFY_FAILED.  certifi is a direct
@@ -15,7 +21,6 @@ if not os.environ.get("SSL_CERT_FILE"):
     os.environ["SSL_CERT_FILE"] = certifi.where()
 
 import click
-import numpy as np
 
 from vaani.config import (
     CONFIG_FILE,
@@ -25,16 +30,32 @@ from vaani.config import (
     get_openai_key,
     load_config,
     save_config,
+    save_generation,
     set_api_key,
 )
 from vaani import __version__
 from vaani.state import AppState, StateMachine
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger("vaani")
 
 
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(config: VaaniConfig) -> None:
-    """Configure rotating file + stderr logging."""
+    """Configure rotating file + stderr logging.
+
+    Records are handed to a QueueListener thread that owns the real handlers,
+    so logging from the hotkey and pipeline threads never waits on disk I/O.
+    Repeat calls are no-ops.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
     log_path = Path(config.log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -51,31 +72,137 @@ def setup_logging(config: VaaniConfig) -> None:
     stderr.setLevel(logging.WARNING)
     stderr.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
 
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, handler, stderr, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(_stop_logging)
+
     root = logging.getLogger("vaani")
     root.setLevel(logging.INFO)
-    root.addHandler(handler)
-    root.addHandler(stderr)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def _stop_logging() -> None:
+    """Drain queued log records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+PENDING_PATH = VAANI_DIR / "pending" / "last_recording.wav"  # raw audio kept until a run succeeds
+
+PID_FILE = VAANI_DIR / "vaani.pid"
+_pid_file_fd: Optional[int] = None
+
+
+def _claim_pid_file() -> bool:
+    """Write this process's PID to PID_FILE and hold an exclusive lock on it.
+
+    The lock lives as long as the process (the kernel drops it on exit, even
+    on a crash), so a locked pidfile always names a live Vaani instance and a
+    stale one is never mistaken for it. Returns False if another instance
+    still holds the lock.
+    """
+    global _pid_file_fd
+    PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(PID_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _pid_file_fd = fd
+    return True
+
+
+def _stop_running_instance(timeout: float = 2.0) -> None:
+    """SIGTERM the instance holding PID_FILE's lock and wait for it to exit."""
+    try:
+        fd = os.open(PID_FILE, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            return  # not locked: nothing running, the file is stale
+        except BlockingIOError:
+            pass
+
+        try:
+            pid = int(os.read(fd, 32))
+            os.kill(pid, signal.SIGTERM)
+        except (ValueError, OSError):
+            logger.warning("Could not signal running Vaani instance from %s", PID_FILE)
+            return
+
+        # The lock is released the moment the old process exits
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                time.sleep(0.01)
+        logger.warning("Vaani instance %d did not exit within %.0fs", pid, timeout)
+    finally:
+        os.close(fd)
+
+
+def _config_mtime_ns() -> int:
+    """Config file mtime in integer nanoseconds (0 if missing), with a single stat()."""
+    try:
+        return os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
 
 
 class VaaniApp:
     """Orchestrates the full voice-to-text pipeline."""
 
     PREWARM_TIMEOUT = 120  # seconds to wait for models before allowing recording
+    CONFIG_CHECK_TTL = 2.0  # seconds between config file stat() checks
+    MIN_SPEECH_SECONDS = 0.3  # shorter recordings are accidental hotkey taps
 
     def __init__(self, config: VaaniConfig) -> None:
         self.config = config
-        self._config_mtime: float = CONFIG_FILE.stat().st_mtime if CONFIG_FILE.exists() else 0
+        self._config_mtime: int = _config_mtime_ns()
+        self._config_check_ts: float = 0.0
+        self._config_generation: int = save_generation()
         self.state = StateMachine()
         self.menubar = None
         self._recorder = None
-        self._history = None
+        self._recorder_lock = threading.Lock()
+        self._history = None  # only touched from the pipeline worker
+        self._pipeline = None
         self._hotkey_listener = None
+        self._auto_stop_timer: Optional[threading.Timer] = None
         self._prewarm_done = threading.Event()
+        # One long-lived worker runs prewarm, then each recording's pipeline, in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vaani-pipeline")
 
     def _reload_config_if_changed(self) -> None:
-        """Reload config from disk only if the file was modified since last check."""
+        """Reload config from disk only if the file was modified since last check.
+
+        The stat() itself is skipped if the previous check was less than
+        ``CONFIG_CHECK_TTL`` seconds ago, so rapid hotkey presses cost nothing.
+        Saves made in this process (settings window, menu bar) bypass the TTL
+        and are picked up on the next call.
+        """
+        now = time.monotonic()
+        generation = save_generation()
+        if (generation == self._config_generation
+                and now - self._config_check_ts < self.CONFIG_CHECK_TTL):
+            return
+        self._config_generation = generation
+        self._config_check_ts = now
+
         try:
-            mtime = CONFIG_FILE.stat().st_mtime if CONFIG_FILE.exists() else 0
+            mtime = _config_mtime_ns()
         except OSError:
             return
 
@@ -86,35 +213,51 @@ class VaaniApp:
         new_config = load_config()
 
         # Reset recorder if any audio config changed
+        reset_recorder = False
         if new_config.microphone_device != self.config.microphone_device:
             logger.info(
                 "Microphone changed: %s → %s",
                 self.config.microphone_device, new_config.microphone_device,
             )
-            self._recorder = None
+            reset_recorder = True
         if new_config.sample_rate != self.config.sample_rate:
             logger.info(
                 "Sample rate changed: %s → %s",
                 self.config.sample_rate, new_config.sample_rate,
             )
-            self._recorder = None
+            reset_recorder = True
 
         # Restart hotkey listener if hotkey changed
         if new_config.hotkey != self.config.hotkey:
             logger.info("Hotkey changed: %s → %s", self.config.hotkey, new_config.hotkey)
             self._restart_hotkey_listener(new_config.hotkey)
 
-        self.config = new_config
+        # Under the recorder lock, so _get_recorder never builds one from the
+        # old config after the reset
+        with self._recorder_lock:
+            if reset_recorder:
+                self._recorder = None
+            self.config = new_config
         logger.info("Config reloaded from disk")
 
     def _get_recorder(self):
-        from vaani.audio import AudioRecorder
-        if self._recorder is None:
-            self._recorder = AudioRecorder(
-                sample_rate=self.config.sample_rate,
-                device=self.config.microphone_device,
-            )
-        return self._recorder
+        """Return the shared recorder, creating it on first use.
+
+        Prewarm, the hotkey dispatch thread and the menu bar can all reach
+        this; the lock ensures only one AudioRecorder (and one PortAudio
+        re-initialization) is ever built, with or without a GIL.
+        """
+        recorder = self._recorder
+        if recorder is not None:
+            return recorder
+        with self._recorder_lock:
+            if self._recorder is None:
+                from vaani.audio import AudioRecorder
+                self._recorder = AudioRecorder(
+                    sample_rate=self.config.sample_rate,
+                    device=self.config.microphone_device,
+                )
+            return self._recorder
 
     def _get_history(self):
         from vaani.storage import HistoryStore
@@ -122,8 +265,26 @@ class VaaniApp:
             self._history = HistoryStore()
         return self._history
 
+    def _get_pipeline(self):
+        """Resolve the pipeline stage functions once, so import errors surface at prewarm."""
+        if self._pipeline is None:
+            from vaani.audio import process_audio, wav_duration, write_wav
+            from vaani.enhance import enhance
+            from vaani.output import paste_text
+            from vaani.transcribe import transcribe
+            self._pipeline = (
+                write_wav, process_audio, wav_duration, transcribe, enhance, paste_text,
+            )
+        return self._pipeline
+
     def _restart_hotkey_listener(self, new_hotkey: str) -> None:
         """Stop and restart the hotkey listener with a new hotkey."""
+        if threading.current_thread() is not threading.main_thread():
+            # Reached from start_recording on the hotkey dispatch thread;
+            # NSEvent monitors must be added and removed on the main thread.
+            from PyObjCTools import AppHelper
+            AppHelper.callAfter(self._restart_hotkey_listener, new_hotkey)
+            return
         if self._hotkey_listener:
             self._hotkey_listener.stop()
         from vaani.hotkey import HotkeyListener
@@ -137,11 +298,16 @@ class VaaniApp:
 
     def start_recording(self) -> None:
         """Begin recording audio from the microphone."""
-        if not self._prewarm_done.wait(timeout=self.PREWARM_TIMEOUT):
-            logger.error("Prewarm did not complete within %ds — refusing to record", self.PREWARM_TIMEOUT)
+        if not self._prewarm_done.is_set():
+            # Tell the user right away, then hold the press until models are
+            # ready (this runs on the hotkey dispatch thread, not the run loop).
             if self.menubar:
                 self.menubar.show_notification("Vaani", "Models still loading, please wait...")
-            return
+            if not self._prewarm_done.wait(timeout=self.PREWARM_TIMEOUT):
+                logger.error("Prewarm did not complete within %ds — refusing to record", self.PREWARM_TIMEOUT)
+                if self.menubar:
+                    self.menubar.show_notification("Vaani", "Models are taking too long to load, try again shortly")
+                return
 
         self._reload_config_if_changed()
 
@@ -160,22 +326,29 @@ class VaaniApp:
         recorder = self._get_recorder()
         recorder.start()
 
-        # Auto-stop after max recording time
-        def _auto_stop():
-            time.sleep(self.config.max_recording_seconds)
-            if self.state.is_recording:
-                logger.warning("Max recording length reached, auto-stopping")
-                if self.menubar:
-                    self.menubar.show_notification("Vaani", "Max recording length reached")
-                self.stop_recording()
+        # Auto-stop after max recording time; cancelled by stop/cancel
+        self._auto_stop_timer = threading.Timer(self.config.max_recording_seconds, self._auto_stop)
+        self._auto_stop_timer.daemon = True
+        self._auto_stop_timer.start()
 
-        threading.Thread(target=_auto_stop, daemon=True).start()
+    def _auto_stop(self) -> None:
+        if self.state.is_recording:
+            logger.warning("Max recording length reached, auto-stopping")
+            if self.menubar:
+                self.menubar.show_notification("Vaani", "Max recording length reached")
+            self.stop_recording()
+
+    def _cancel_auto_stop(self) -> None:
+        if self._auto_stop_timer is not None:
+            self._auto_stop_timer.cancel()
+            self._auto_stop_timer = None
 
     def stop_recording(self) -> None:
         """Stop recording and process the audio."""
         if not self.state.is_recording:
             return
 
+        self._cancel_auto_stop()
         recorder = self._get_recorder()
         audio = recorder.stop()
 
@@ -189,16 +362,15 @@ class VaaniApp:
             self.menubar.update_state(AppState.PROCESSING)
 
 
-        # Process in background thread
-        threading.Thread(
-            target=self._process_audio, args=(audio,), daemon=True
-        ).start()
+        # Process on the pipeline worker
+        self._executor.submit(self._process_audio, audio)
 
     def cancel_recording(self) -> None:
         """Cancel recording, discard audio."""
         if not self.state.is_recording:
             return
 
+        self._cancel_auto_stop()
         recorder = self._get_recorder()
         recorder.cancel()
         self.state.transition(AppState.IDLE)
@@ -214,21 +386,23 @@ class VaaniApp:
         elif self.state.is_recording:
             self.stop_recording()
 
-    def _process_audio(self, audio: np.ndarray) -> None:
+    def _process_audio(self, audio: "np.ndarray") -> None:
         """Full processing pipeline: VAD → STT → LLM → paste."""
         try:
-            from vaani.audio import process_audio
-            from vaani.enhance import enhance
-            from vaani.output import paste_text
-            from vaani.transcribe import transcribe
-
-            audio_length_secs = len(audio) / self.config.sample_rate
+            (write_wav, process_audio, wav_duration,
+             transcribe, enhance, paste_text) = self._get_pipeline()
+
+            # Taps and dead-silent input can't hold speech: skip the pending
+            # write and the VAD pass. The peak is two vectorized reductions.
+            if (len(audio) < self.MIN_SPEECH_SECONDS * self.config.sample_rate
+                    or max(audio.max(), -audio.min()) < self.config.silence_peak_threshold):
+                logger.info("Recording too short or silent (%d samples), skipping VAD", len(audio))
+                if self.menubar:
+                    self.menubar.show_notification("Vaani", "No speech detected")
+                return
 
-            # Save pending audio in case of failure
-            pending_path = VAANI_DIR / "pending" / "last_recording.wav"
-            pending_path.parent.mkdir(parents=True, exist_ok=True)
-            from vaani.audio import encode_wav
-            pending_path.write_bytes(encode_wav(audio, self.config.sample_rate))
+            # Save pending audio in case of failure (directory made at prewarm)
+            write_wav(PENDING_PATH, audio, self.config.sample_rate)
 
             # Audio processing (VAD + gain norm + WAV encode)
             wav_bytes = process_audio(
@@ -241,6 +415,9 @@ class VaaniApp:
                     self.menubar.show_notification("Vaani", "No speech detected")
                 return
 
+            # History records the speech that was sent, not the silence VAD dropped
+            audio_length_secs = wav_duration(wav_bytes, self.config.sample_rate)
+
             # Transcribe
             raw_text = transcribe(wav_bytes, model=self.config.stt_model)
             if not raw_text.strip() or len(raw_text.strip()) < 3:
@@ -271,8 +448,7 @@ class VaaniApp:
                 logger.exception("Failed to store history")
 
             # Clean up pending audio on success
-            if pending_path.exists():
-                pending_path.unlink()
+            PENDING_PATH.unlink(missing_ok=True)
 
         except Exception as e:
             logger.exception("Processing pipeline failed")
@@ -286,26 +462,48 @@ class VaaniApp:
                 self.menubar.update_state(AppState.IDLE)
 
     def _prewarm(self) -> None:
-        """Pre-initialize recorder, VAD, and NER models before accepting recordings."""
+        """Pre-initialize recorder, VAD, NER models and API clients before accepting recordings."""
         try:
+            PENDING_PATH.parent.mkdir(parents=True, exist_ok=True)
             self._get_recorder()
             from vaani.audio import _load_vad
             _load_vad()
             from vaani.output import _load_nlp
             _load_nlp()
+            # The OpenAI and Anthropic SDKs take over a second to import —
+            # pay that here rather than on the first dictation.
+            self._get_pipeline()
+            self._build_api_clients()
             logger.info("Prewarm complete — all models loaded")
         except Exception:
             logger.exception("Prewarm failed")
         finally:
             self._prewarm_done.set()
 
+    def _build_api_clients(self) -> None:
+        """Construct the cached STT and LLM clients ahead of the first dictation.
+
+        Building a client creates its httpx pool and SSL context, which loads
+        the CA bundle. No request is sent: the SDK pools expire idle
+        connections after 5 s, so a warmed connection would rarely survive
+        until the user speaks.
+        """
+        from vaani.enhance import _get_client as anthropic_client
+        from vaani.transcribe import _get_client as openai_client
+
+        for get_key, build in ((get_openai_key, openai_client),
+                               (get_anthropic_key, anthropic_client)):
+            key = get_key()
+            if key:
+                build(key)
+
     def run(self) -> None:
         """Start the app: hotkey listener + menu bar (main thread)."""
         import rumps as _rumps
         from vaani.hotkey import HotkeyListener
         from vaani.menubar import VaaniMenuBar
 
-        threading.Thread(target=self._prewarm, daemon=True).start()
+        self._executor.submit(self._prewarm)
 
         self.menubar = VaaniMenuBar(
             on_toggle_recording=self.toggle_recording,
@@ -321,7 +519,15 @@ class VaaniApp:
             )
             self._hotkey_listener.start()
 
-        self.menubar.run()  # Blocks until quit
+        try:
+            self.menubar.run()  # Blocks until quit
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the pipeline worker; a recording already being processed still finishes."""
+        self._cancel_auto_stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 # --- CLI ---
@@ -411,21 +617,15 @@ def start(foreground):
         click.echo("API keys not configured. Running setup...")
         setup()
 
-    # Kill existing Vaani processes
-    try:
-        subprocess.run(
-            ["pkill", "-f", "vaani start"],
-            capture_output=True,
-            timeout=5
-        )
-        time.sleep(1)
-    except Exception:
-        pass
+    # Stop an already-running Vaani instance
+    _stop_running_instance()
 
     # Foreground mode (interactive, for debugging)
     if foreground:
         config = load_config()
         setup_logging(config)
+        if not _claim_pid_file():
+            logger.warning("Another Vaani instance still holds %s", PID_FILE)
         logger.info("Starting Vaani v%s (foreground)", __version__)
         app = VaaniApp(config)
         app.run()
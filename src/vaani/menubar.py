@@ -1,6 +1,7 @@
 """macOS menu bar app using rumps."""
 
 import logging
+import queue
 import subprocess
 import threading
 from functools import wraps
@@ -9,6 +10,11 @@ from typing import Callable, Optional
 
 import rumps
 
+try:
+    from AppKit import NSSound as _NSSound
+except ImportError:
+    _NSSound = None  # Non-macOS / test environments: fall back to afplay
+
 from vaani.config import MODES, load_config, save_config
 from vaani.state import AppState
 
@@ -28,6 +34,14 @@ logger = logging.getLogger(__name__)
 ICON_PATH = Path(__file__).parent.parent.parent / "assets" / "mic_template.png"
 SOUNDS_DIR = Path(__file__).parent / "sounds"
 
+# Bundled cues are pre-generated by generate_sounds.py and shipped with the
+# package; index them once at import instead of stat-ing on every hotkey press.
+_BUNDLED_SOUNDS = {p.stem: str(p) for p in SOUNDS_DIR.glob("*.wav")}
+
+# Loaded NSSound per cue name; replaying one is a stop() + play() on the
+# main thread instead of an afplay fork.
+_sound_cache: dict = {}
+
 
 class VaaniMenuBar(rumps.App):
     """Native macOS menu bar app for Vaani."""
@@ -40,6 +54,9 @@ class VaaniMenuBar(rumps.App):
         super().__init__("Vaani", icon=icon, template=True, quit_button=None)
 
         self._on_toggle_recording = on_toggle_recording
+        self._toggle_requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._toggle_worker: Optional[threading.Thread] = None
+        self._active_mode_item: Optional[rumps.MenuItem] = None
         self._level_timer: Optional[rumps.Timer] = None
         self._anim_frame = 0
 
@@ -71,26 +88,50 @@ class VaaniMenuBar(rumps.App):
         self.menu.add(rumps.MenuItem("Quit Vaani", callback=self._quit))
 
     def _toggle_recording(self, sender) -> None:
-        if self._on_toggle_recording:
-            threading.Thread(
-                target=self._on_toggle_recording, daemon=True
-            ).start()
+        """Hand the click to the toggle worker, keeping the main thread free.
+
+        One long-lived worker runs clicks in order: start_recording may wait
+        on prewarm, and a queued stop must not race ahead of it.
+        """
+        if not self._on_toggle_recording:
+            return
+        if self._toggle_worker is None:
+            self._toggle_worker = threading.Thread(
+                target=self._toggle_loop, name="menubar-toggle", daemon=True
+            )
+            self._toggle_worker.start()
+        self._toggle_requests.put(sender)
 
+    def _toggle_loop(self) -> None:
+        while True:
+            self._toggle_requests.get()
+            try:
+                self._on_toggle_recording()
+            except Exception:
+                logger.exception("Toggle recording failed")
+
+    @_on_main_thread
     def _refresh_mode_menu(self) -> None:
         """Sync mode submenu checkmarks with current config."""
         cfg = load_config()
         active = cfg.active_mode
+        self._active_mode_item = None
         for item in self._mode_menu.values():
             item.state = item.title.lower() == active
+            if item.state:
+                self._active_mode_item = item
 
+    @_on_main_thread
     def _on_mode_select(self, sender) -> None:
         """Handle mode selection from submenu."""
         cfg = load_config()
         cfg.active_mode = sender.title.lower()
         save_config(cfg)
-        for item in self._mode_menu.values():
-            item.state = False
+        # Only the old and new checkmarks change; each state write is a bridge call
+        if self._active_mode_item is not None and self._active_mode_item is not sender:
+            self._active_mode_item.state = False
         sender.state = True
+        self._active_mode_item = sender
 
     def _open_preferences(self, sender) -> None:
         """Open settings window in-process (native NSWindow, instant)."""
@@ -140,18 +181,29 @@ class VaaniMenuBar(rumps.App):
         """Show a macOS notification."""
         rumps.notification(title, "", message)
 
+    @_on_main_thread
     def play_sound(self, sound_name: str) -> None:
         """Play a sound by name.
 
         Looks for a bundled WAV file in the sounds directory first
         (e.g. ``sounds/record_start.wav``), then falls back to a macOS
         system sound (e.g. ``/System/Library/Sounds/<name>.aiff``).
+        Sounds are played in-process with NSSound; ``afplay`` is only used
+        without AppKit.
         """
-        bundled = SOUNDS_DIR / f"{sound_name}.wav"
-        if bundled.exists():
-            path = str(bundled)
-        else:
-            path = f"/System/Library/Sounds/{sound_name}.aiff"
+        path = _BUNDLED_SOUNDS.get(sound_name) or f"/System/Library/Sounds/{sound_name}.aiff"
+
+        if _NSSound is not None:
+            sound = _sound_cache.get(sound_name)
+            if sound is None:
+                sound = _NSSound.alloc().initWithContentsOfFile_byReference_(path, True)
+                if sound is None:
+                    logger.debug("Failed to load sound: %s", path)
+                    return
+                _sound_cache[sound_name] = sound
+            sound.stop()  # restart a cue that is still playing
+            sound.play()
+            return
 
         try:
             subprocess.Popen(
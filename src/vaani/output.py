@@ -1,17 +1,39 @@
 """Clipboard-safe paste: save clipboard → copy text → Cmd+V → restore clipboard."""
 
 import logging
+import re
 import subprocess
 import threading
 import time
+from functools import lru_cache
+
 from pynput.keyboard import Controller, Key
 
+try:
+    from AppKit import NSPasteboard as _NSPasteboard
+    from AppKit import NSPasteboardTypeString as _NSPasteboardTypeString
+except ImportError:
+    _NSPasteboard = None  # Non-macOS / test environments: fall back to pbcopy/pbpaste
+
 logger = logging.getLogger(__name__)
 
 # Lazy-loaded spaCy NER model
 _nlp = None
 _nlp_lock = threading.Lock()
 
+# en_core_web_sm's ner pipe has its own embedding layer; the shared tok2vec
+# and the pipes it feeds only produce tags, parses and lemmas, which name
+# formatting never reads.
+_NLP_DISABLED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# A name needs a capitalized word; text without one skips the NER pass.
+# Matches the first letter of each word, in any script ("Émile", "Łukasz").
+_WORD_INITIAL = re.compile(r"\b[^\W\d_]")
+
+
+def _has_capitalized_word(text: str) -> bool:
+    return any(m.group().isupper() for m in _WORD_INITIAL.finditer(text))
+
 
 def _load_nlp():
     """Load spaCy NER model. Should be called during prewarm, not during recording."""
@@ -25,7 +47,7 @@ def _load_nlp():
         try:
             import spacy
             logger.info("Loading spaCy NER model...")
-            _nlp = spacy.load("en_core_web_sm")
+            _nlp = spacy.load("en_core_web_sm", disable=_NLP_DISABLED_PIPES)
             logger.info("spaCy NER model loaded")
         except Exception as e:
             logger.warning("Failed to load spaCy NER: %s", e)
@@ -38,33 +60,47 @@ def is_nlp_loaded() -> bool:
 
 
 def _format_names_with_at(text: str) -> str:
-    """Use NER to identify person names and format with @ prefix."""
+    """Use NER to identify person names and format with @ prefix.
+
+    The model is loaded at prewarm. If it isn't available, the text is
+    returned unformatted rather than stalling the paste on a model load.
+    """
     try:
-        _load_nlp()
-        if _nlp is None:
+        if _nlp is None or not _has_capitalized_word(text):
             return text
 
         doc = _nlp(text)
-        formatted = text
+        if not any(ent.label_ == "PERSON" for ent in doc.ents):
+            return text  # the common case: nothing to rewrite
 
-        # Process entities in reverse order to maintain string positions
-        for ent in reversed(doc.ents):
+        # One left-to-right pass over the (ordered) entities, joined once
+        parts = []
+        cursor = 0
+        for ent in doc.ents:
             if ent.label_ == "PERSON":
                 name = ent.text.strip()
                 # Skip if already formatted with @
                 if not name.startswith("@"):
-                    # Replace the name with @-prefixed version
-                    formatted = formatted[:ent.start_char] + "@" + name + formatted[ent.end_char:]
+                    parts.append(text[cursor:ent.start_char])
+                    parts.append("@" + name)
+                    cursor = ent.end_char
+        parts.append(text[cursor:])
 
-        return formatted
+        return "".join(parts)
     except Exception as e:
         logger.debug("NER formatting failed: %s", e)
         return text
 
 
+@lru_cache(maxsize=1)
+def _get_keyboard() -> Controller:
+    """Shared pynput Controller, so its CGEventSource is created once."""
+    return Controller()
+
+
 def _do_cmd_v() -> None:
     """Press Cmd+V using pynput. Must be called on the main thread when NSApp is active."""
-    keyboard = Controller()
+    keyboard = _get_keyboard()
     with keyboard.pressed(Key.cmd):
         keyboard.tap('v')
 
@@ -87,40 +123,53 @@ def _simulate_cmd_v(restore_delay_ms: int) -> None:
             def _on_main():
                 try:
                     _do_cmd_v()
-                    time.sleep(restore_delay_ms / 1000.0)
                 finally:
                     done.set()
 
             AppHelper.callAfter(_on_main)
             if not done.wait(timeout=10):
                 logger.error("Timed out dispatching Cmd+V to main thread")
+            # Wait here, not on the main thread, so the menu bar stays live
+            if restore_delay_ms:
+                time.sleep(restore_delay_ms / 1000.0)
             return
     except ImportError:
         pass
 
     _do_cmd_v()
-    time.sleep(restore_delay_ms / 1000.0)
+    if restore_delay_ms:
+        time.sleep(restore_delay_ms / 1000.0)
 
 
 def _get_clipboard() -> str:
-    """Get current clipboard contents via pbpaste."""
+    """Get current clipboard text from NSPasteboard (pbpaste without AppKit)."""
+    if _NSPasteboard is not None:
+        return _NSPasteboard.generalPasteboard().stringForType_(_NSPasteboardTypeString) or ""
     try:
-        result = subprocess.run(
-            ["pbpaste"], capture_output=True, text=True, timeout=5
-        )
-        return result.stdout
+        result = subprocess.run(["pbpaste"], capture_output=True, timeout=5)
+        return result.stdout.decode("utf-8", errors="replace")
     except Exception:
         logger.warning("Failed to read clipboard")
         return ""
 
 
 def _set_clipboard(text: str) -> None:
-    """Set clipboard contents via pbcopy."""
+    """Set clipboard text on NSPasteboard (pbcopy without AppKit).
+
+    The in-process pasteboard call replaces a pbcopy fork+exec, and is
+    synchronous: the text is on the pasteboard when it returns.
+    """
+    if _NSPasteboard is not None:
+        pb = _NSPasteboard.generalPasteboard()
+        pb.clearContents()
+        if not pb.setString_forType_(text, _NSPasteboardTypeString):
+            logger.warning("Failed to set clipboard")
+        return
     try:
+        # Raw bytes: one encode, and no newline translation of the clipboard
         subprocess.run(
             ["pbcopy"],
-            input=text,
-            text=True,
+            input=text.encode("utf-8"),
             timeout=5,
             check=True,
         )
@@ -142,14 +191,18 @@ def paste_text(text: str, restore_delay_ms: int = 100) -> None:
     text = _format_names_with_at(text)
 
     original = _get_clipboard()
+    # Nothing to put back if the clipboard held no text or already held this
+    # text; then skip the restore write and the wait that protects it.
+    restore = bool(original) and original != text
 
-    _set_clipboard(text)
-
-    # Small delay to ensure clipboard is set
-    time.sleep(0.05)
+    if original != text:
+        # Synchronous: the pasteboard holds the text once this returns
+        _set_clipboard(text)
 
-    _simulate_cmd_v(restore_delay_ms)
+    _simulate_cmd_v(restore_delay_ms if restore else 0)
 
-    # Restore original clipboard
-    _set_clipboard(original)
-    logger.info("Text pasted at cursor (%d chars), clipboard restored", len(text))
+    if restore:
+        _set_clipboard(original)
+        logger.info("Text pasted at cursor (%d chars), clipboard restored", len(text))
+    else:
+        logger.info("Text pasted at cursor (%d chars)", len(text))
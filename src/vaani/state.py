@@ -25,10 +25,11 @@ class StateMachine:
     def __init__(self) -> None:
         self._state = AppState.IDLE
         self._lock = threading.Lock()
-        self._listeners: list = []
+        self._listeners: tuple = ()
 
     @property
     def state(self) -> AppState:
+        # Lock-free read: _state is only ever rebound to an immutable enum
         return self._state
 
     def transition(self, target: AppState) -> bool:
@@ -42,9 +43,10 @@ class StateMachine:
             old = self._state
             self._state = target
             logger.info("State: %s → %s", old.value, target.value)
+            listeners = self._listeners
 
         # Notify listeners outside lock
-        for cb in self._listeners:
+        for cb in listeners:
             try:
                 cb(old, target)
             except Exception:
@@ -53,7 +55,9 @@ class StateMachine:
 
     def on_change(self, callback) -> None:
         """Register a callback(old_state, new_state)."""
-        self._listeners.append(callback)
+        # Copy-on-write, so a transition in flight keeps iterating its snapshot
+        with self._lock:
+            self._listeners = self._listeners + (callback,)
 
     @property
     def is_idle(self) -> bool:
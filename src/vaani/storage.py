@@ -4,7 +4,7 @@ import logging
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from cryptography.fernet import Fernet
 
@@ -15,9 +15,17 @@ logger = logging.getLogger(__name__)
 DB_PATH = VAANI_DIR / "history.db"
 
 
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
 class HistoryStore:
     """Encrypted transcription history stored in SQLite."""
 
+    _INSERT_SQL = """INSERT INTO history (timestamp, mode, raw_encrypted, enhanced_encrypted,
+               audio_length_secs, language)
+               VALUES (?, ?, ?, ?, ?, ?)"""
+
     def __init__(self, db_path: Optional[Path] = None) -> None:
         self._db_path = db_path or DB_PATH
         self._fernet: Optional[Fernet] = None
@@ -31,7 +39,18 @@ class HistoryStore:
         self._fernet = Fernet(key)
 
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        # Autocommit: each single INSERT is its own transaction, batches open
+        # one explicitly, and sqlite3 stops inspecting every statement to
+        # decide when to BEGIN on our behalf.
+        self._conn = sqlite3.connect(
+            str(self._db_path), isolation_level=None, check_same_thread=False
+        )
+        # WAL: a commit appends to the log instead of rewriting a rollback
+        # journal, and readers (the settings UI) don't block the writer.
+        # NORMAL is durable across app crashes; only power loss can drop
+        # the last commits.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._conn.execute("""
             CREATE TABLE IF NOT EXISTS history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -43,7 +62,6 @@ class HistoryStore:
                 language TEXT
             )
         """)
-        self._conn.commit()
         logger.info("History database initialized at %s", self._db_path)
 
     def add(
@@ -57,28 +75,57 @@ class HistoryStore:
         """Add a transcription record. Text is encrypted before storage."""
         self._ensure_initialized()
 
-        raw_enc = self._fernet.encrypt(raw_text.encode())
-        enhanced_enc = self._fernet.encrypt(enhanced_text.encode())
-
         cursor = self._conn.execute(
-            """INSERT INTO history (timestamp, mode, raw_encrypted, enhanced_encrypted,
-               audio_length_secs, language)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (
-                datetime.now(timezone.utc).isoformat(),
-                mode,
-                raw_enc,
-                enhanced_enc,
-                audio_length_secs,
-                language,
-            ),
+            self._INSERT_SQL,
+            self._row(_now(), raw_text, enhanced_text, mode, audio_length_secs, language),
         )
-        self._conn.commit()
         logger.info("History record added (id=%d)", cursor.lastrowid)
         return cursor.lastrowid
 
+    def add_many(self, records: Iterable[dict]) -> int:
+        """Add several records (keyword arguments of ``add``) in one transaction.
+
+        One commit for the whole batch instead of one per row, and the records
+        share the batch's timestamp. Returns the number of records inserted.
+        """
+        self._ensure_initialized()
+
+        timestamp = _now()
+        rows = [self._row(timestamp, **record) for record in records]
+        self._conn.execute("BEGIN")
+        with self._conn:  # COMMIT, or ROLLBACK on error
+            self._conn.executemany(self._INSERT_SQL, rows)
+        logger.info("History records added (%d)", len(rows))
+        return len(rows)
+
+    def _row(
+        self,
+        timestamp: str,
+        raw_text: str,
+        enhanced_text: str,
+        mode: str,
+        audio_length_secs: Optional[float] = None,
+        language: Optional[str] = None,
+    ) -> tuple:
+        return (
+            timestamp,
+            mode,
+            self._fernet.encrypt(raw_text.encode()),
+            self._fernet.encrypt(enhanced_text.encode()),
+            audio_length_secs,
+            language,
+        )
+
     def get_recent(self, limit: int = 20) -> list[dict]:
         """Get recent history entries, decrypted."""
+        return list(self.iter_recent(limit))
+
+    def iter_recent(self, limit: int = 20) -> Iterator[dict]:
+        """Yield recent history entries, newest first, decrypting one row at a time.
+
+        Rows are pulled from the cursor as the caller advances, so stopping
+        early skips fetching and decrypting the rest.
+        """
         self._ensure_initialized()
 
         rows = self._conn.execute(
@@ -86,9 +133,8 @@ class HistoryStore:
                audio_length_secs, language
                FROM history ORDER BY id DESC LIMIT ?""",
             (limit,),
-        ).fetchall()
+        )
 
-        results = []
         for row in rows:
             try:
                 raw = self._fernet.decrypt(row[3]).decode()
@@ -97,7 +143,7 @@ class HistoryStore:
                 logger.warning("Failed to decrypt record id=%d", row[0])
                 continue
 
-            results.append({
+            yield {
                 "id": row[0],
                 "timestamp": row[1],
                 "mode": row[2],
@@ -105,8 +151,7 @@ class HistoryStore:
                 "enhanced": enhanced,
                 "audio_length_secs": row[5],
                 "language": row[6],
-            })
-        return results
+            }
 
     def close(self) -> None:
         if self._conn:
@@ -1,8 +1,8 @@
 """OpenAI Whisper API transcription."""
 
-import io
 import logging
 import time
+from functools import lru_cache
 
 from openai import OpenAI
 
@@ -11,6 +11,12 @@ from vaani.config import get_openai_key
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> OpenAI:
+    """Shared client per API key, so its connection pool and TLS sessions are reused."""
+    return OpenAI(api_key=api_key)
+
+
 def transcribe(wav_bytes: bytes, model: str = "gpt-4o-mini-transcribe") -> str:
     """Send WAV audio to OpenAI Whisper API and return transcribed text.
 
@@ -30,15 +36,14 @@ def transcribe(wav_bytes: bytes, model: str = "gpt-4o-mini-transcribe") -> str:
             "OpenAI API key not found. Run 'vaani setup' to configure."
         )
 
-    client = OpenAI(api_key=api_key)
-
-    audio_file = io.BytesIO(wav_bytes)
-    audio_file.name = "recording.wav"
+    client = _get_client(api_key)
 
+    # A (name, bytes, type) tuple goes into the multipart body as-is; a
+    # file object would be re-read and copied in 64 KiB chunks.
     start = time.monotonic()
     response = client.audio.transcriptions.create(
         model=model,
-        file=audio_file,
+        file=("recording.wav", wav_bytes, "audio/wav"),
     )
     elapsed = time.monotonic() - start
 
@@ -3,8 +3,9 @@
 import ctypes
 import ctypes.util
 import logging
+import os
 import threading
-from typing import Optional
+from typing import Callable, Optional
 
 import objc
 
@@ -38,6 +39,22 @@ def _ax_is_trusted() -> bool:
         return False
 
 
+def _open_url(url) -> None:
+    """Open a URL, or a file path via a file URL, with its default app.
+
+    Goes through NSWorkspace in-process rather than forking /usr/bin/open.
+    """
+    from AppKit import NSWorkspace
+    from Foundation import NSURL
+
+    if isinstance(url, str):
+        ns_url = NSURL.URLWithString_(url)
+    else:
+        ns_url = NSURL.fileURLWithPath_(str(url))
+    if not NSWorkspace.sharedWorkspace().openURL_(ns_url):
+        raise RuntimeError(f"Could not open {url}")
+
+
 def _ax_request_trust() -> bool:
     """Check accessibility and trigger the macOS system prompt if not trusted."""
     try:
@@ -64,29 +81,60 @@ class VaaniAPI:
     def __init__(self) -> None:
         self._recorder = None
         self._mic_test_thread: Optional[threading.Thread] = None
-        self._mic_testing = threading.Event()
+        self._mic_test_stop: Optional[threading.Event] = None
         self._current_level: float = 0.0
-        self._window = None  # set by launcher to allow close_window()
-        self.close_requested = threading.Event()
+        self._close_callback: Optional[Callable[[], None]] = None  # set by the launcher
+        self._config_cache = None  # ((save generation, mtime), VaaniConfig)
 
     # --- Window ---
 
     def close_window(self) -> dict:
-        """Signal that the window should close.
+        """Close the window this API is attached to.
 
-        The actual destroy() is performed by a watcher thread in the launcher
-        so we never tear down the WKWebView from inside its own JS bridge call.
+        The launcher's close callback is queued on the main run loop, so the
+        WKWebView is never torn down from inside its own JS bridge call.
         """
-        self.close_requested.set()
+        if self._close_callback is not None:
+            from PyObjCTools import AppHelper
+            AppHelper.callAfter(self._close_callback)
         return {"ok": True}
 
     # --- Config ---
 
+    def _config_key(self) -> tuple:
+        """(save generation, config file mtime) identifying the config on disk."""
+        cfg = _config()
+        try:
+            mtime = os.stat(cfg.CONFIG_FILE).st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        return cfg.save_generation(), mtime
+
+    def _load_config(self):
+        """Config as last loaded or saved; the YAML is re-read only after a save
+        elsewhere in the process (e.g. the menu bar's mode picker) or an edit
+        from outside it (a hand edit, ``vaani setup``)."""
+        key = self._config_key()
+        cached = self._config_cache
+        if cached is None or cached[0] != key:
+            cached = self._config_cache = (key, _config().load_config())
+        return cached[1]
+
+    def _update_config(self, changes: dict) -> None:
+        """Apply *changes* to a copy of the config, validating only those
+        fields, and save it."""
+        cfg = _config()
+        new_config = self._load_config().model_copy()
+        validator = cfg.VaaniConfig.__pydantic_validator__
+        for field, value in changes.items():
+            validator.validate_assignment(new_config, field, value)
+        cfg.save_config(new_config)
+        self._config_cache = (self._config_key(), new_config)
+
     def get_config(self) -> dict:
         """Return the current config as a dict."""
         try:
-            cfg = _config()
-            config = cfg.load_config()
+            config = self._load_config()
             return config.model_dump()
         except Exception as e:
             logger.exception("Failed to load config")
@@ -95,12 +143,7 @@ class VaaniAPI:
     def save_config(self, data: dict) -> dict:
         """Save config fields. Merges with existing config."""
         try:
-            cfg = _config()
-            config = cfg.load_config()
-            current = config.model_dump()
-            current.update(data)
-            new_config = cfg.VaaniConfig(**current)
-            cfg.save_config(new_config)
+            self._update_config(data)
             return {"ok": True}
         except Exception as e:
             logger.exception("Failed to save config")
@@ -148,13 +191,15 @@ class VaaniAPI:
             from vaani.audio import AudioRecorder
             self._recorder = AudioRecorder(sample_rate=16000, device=device_index)
             self._recorder.start()
-            self._mic_testing.set()
+            # One stop event per test, so a quick restart can't revive the old poller
+            stop = self._mic_test_stop = threading.Event()
 
             def _poll_level():
-                while self._mic_testing.is_set():
+                while True:
                     if self._recorder:
                         self._current_level = self._recorder.current_level
-                    threading.Event().wait(0.05)
+                    if stop.wait(0.05):
+                        return
 
             self._mic_test_thread = threading.Thread(target=_poll_level, daemon=True)
             self._mic_test_thread.start()
@@ -170,7 +215,9 @@ class VaaniAPI:
     def stop_mic_test(self) -> dict:
         """Stop the mic test."""
         try:
-            self._mic_testing.clear()
+            if self._mic_test_stop is not None:
+                self._mic_test_stop.set()
+                self._mic_test_stop = None
             if self._recorder:
                 self._recorder.cancel()
                 self._recorder = None
@@ -184,8 +231,7 @@ class VaaniAPI:
 
     def get_hotkey(self) -> str:
         """Return the current hotkey string."""
-        config = _config().load_config()
-        return config.hotkey
+        return self._load_config().hotkey
 
     def set_hotkey(self, hotkey: str) -> dict:
         """Validate and save a new hotkey."""
@@ -223,11 +269,9 @@ class VaaniAPI:
     def open_accessibility_settings(self) -> dict:
         """Open System Settings → Privacy & Security → Accessibility."""
         try:
-            import subprocess
-            subprocess.Popen([
-                "open",
-                "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility",
-            ])
+            _open_url(
+                "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility"
+            )
             return {"ok": True}
         except Exception as e:
             return {"error": str(e)}
@@ -235,12 +279,7 @@ class VaaniAPI:
     def complete_onboarding(self) -> dict:
         """Mark onboarding as completed and save."""
         try:
-            cfg = _config()
-            config = cfg.load_config()
-            config_data = config.model_dump()
-            config_data["onboarding_completed"] = True
-            new_config = cfg.VaaniConfig(**config_data)
-            cfg.save_config(new_config)
+            self._update_config({"onboarding_completed": True})
             return {"ok": True}
         except Exception as e:
             logger.exception("Failed to complete onboarding")
@@ -256,11 +295,10 @@ class VaaniAPI:
     def open_log_file(self) -> dict:
         """Open the log file in the default editor."""
         try:
-            import subprocess
             cfg = _config()
             log_path = cfg.VAANI_DIR / "vaani.log"
             if log_path.exists():
-                subprocess.Popen(["open", str(log_path)])
+                _open_url(log_path)
             return {"ok": True}
         except Exception as e:
             return {"error": str(e)}
@@ -268,9 +306,8 @@ class VaaniAPI:
     def open_config_dir(self) -> dict:
         """Open the config directory in Finder."""
         try:
-            import subprocess
             cfg = _config()
-            subprocess.Popen(["open", str(cfg.VAANI_DIR)])
+            _open_url(cfg.VAANI_DIR)
             return {"ok": True}
         except Exception as e:
             return {"error": str(e)}
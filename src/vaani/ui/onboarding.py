@@ -1,7 +1,6 @@
 """Onboarding wizard window using pywebview."""
 
 import logging
-import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -28,13 +27,7 @@ def show_onboarding() -> bool:
         on_top=True,
     )
 
-    api._window = window
-
-    def _wait_and_destroy():
-        api.close_requested.wait()
-        window.destroy()
-
-    threading.Thread(target=_wait_and_destroy, daemon=True).start()
+    api._close_callback = window.destroy
 
     webview.start()
 
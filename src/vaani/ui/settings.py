@@ -4,7 +4,8 @@ pywebview for standalone CLI use."""
 import inspect
 import json
 import logging
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import objc
@@ -27,6 +28,11 @@ _refs = {}
 
 _STYLE = 1 | 2 | 4 | 8  # titled | closable | miniaturizable | resizable
 
+# Compact JSON for bridge payloads. Non-ASCII text goes through as-is (the
+# script is handed to WebKit as a Unicode string), which skips \u-escaping
+# every character of a transcript.
+_to_js = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
 # ---------------------------------------------------------------------------
 # JS bridge — auto-generated from VaaniAPI public methods
 # ---------------------------------------------------------------------------
@@ -67,15 +73,24 @@ def _get_api_methods() -> list[str]:
     ]
 
 
+@lru_cache(maxsize=1)
 def _build_bridge_js() -> str:
+    """Bridge script for the static VaaniAPI surface, built on first window open."""
     methods = _get_api_methods()
-    return _BRIDGE_JS_TEMPLATE.format(method_list=json.dumps(methods))
+    return _BRIDGE_JS_TEMPLATE.format(method_list=_to_js(methods))
 
 
 # ---------------------------------------------------------------------------
 # ObjC helpers
 # ---------------------------------------------------------------------------
 
+# JS→Python calls run on a small shared pool (the page polls get_mic_level
+# several times a second); methods that only return in-memory state are
+# answered inline on the main thread.
+_api_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vaani-api")
+_INLINE_METHODS = frozenset({"get_mic_level", "get_version"})
+
+
 class _MessageHandler(NSObject):
     """WKScriptMessageHandler — routes JS calls to VaaniAPI methods."""
 
@@ -98,12 +113,15 @@ class _MessageHandler(NSObject):
                 result = {"error": str(exc)}
 
             if cid and self.webview:
-                js = f"window._resolveCallback('{cid}',{json.dumps(result)})"
+                js = f"window._resolveCallback('{cid}',{_to_js(result)})"
                 AppHelper.callAfter(
                     self.webview.evaluateJavaScript_completionHandler_, js, None
                 )
 
-        threading.Thread(target=_call, daemon=True).start()
+        if name in _INLINE_METHODS:
+            _call()
+        else:
+            _api_executor.submit(_call)
 
 
 class _WindowDelegate(NSObject):
@@ -176,13 +194,7 @@ def open_settings():
     NSApp.activateIgnoringOtherApps_(True)
 
     _window = win
-    api._window = win
-
-    def _wait_and_close():
-        api.close_requested.wait()
-        AppHelper.callAfter(win.close)
-
-    threading.Thread(target=_wait_and_close, daemon=True).start()
+    api._close_callback = win.close
 
 
 # ---------------------------------------------------------------------------
@@ -206,13 +218,7 @@ def show_settings():
         min_size=(500, 400),
         background_color="#f5f5f7",
     )
-    api._window = window
-
-    def _wait_and_destroy():
-        api.close_requested.wait()
-        window.destroy()
-
-    threading.Thread(target=_wait_and_destroy, daemon=True).start()
+    api._close_callback = window.destroy
 
     webview.start()
 
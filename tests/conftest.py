@@ -37,13 +37,33 @@ def mock_keyring(monkeypatch):
     return kr
 
 
+@pytest.fixture(autouse=True)
+def fresh_api_clients():
+    """Drop cached SDK clients so each test's patched client class is used.
+
+    Only modules already imported are touched (a module imported later starts
+    with an empty cache), so tests that never use an SDK don't import one. A
+    module still being imported by an earlier test's worker thread may not
+    define _get_client yet; it has nothing cached either.
+    """
+    def clear():
+        for name in ("vaani.enhance", "vaani.transcribe"):
+            get_client = getattr(sys.modules.get(name), "_get_client", None)
+            if get_client is not None:
+                get_client.cache_clear()
+
+    clear()
+    yield
+    clear()
+
+
 # ---------------------------------------------------------------------------
 # Fernet key fixture
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fernet_key():
-    """Generate a fresh Fernet key for storage tests."""
+    """Generate one Fernet key (immutable bytes) shared by the storage tests."""
     return Fernet.generate_key()
 
 
@@ -55,8 +75,7 @@ def fernet_key():
 def tmp_vaani_dir(tmp_path, monkeypatch):
     """Redirect VAANI_DIR, CONFIG_FILE, and prompt paths to a temp dir."""
     vaani_dir = tmp_path / ".vaani"
-    vaani_dir.mkdir()
-    (vaani_dir / "prompts" / "modes").mkdir(parents=True)
+    (vaani_dir / "prompts" / "modes").mkdir(parents=True)  # creates vaani_dir too
     (vaani_dir / "pending").mkdir()
 
     monkeypatch.setattr("vaani.config.VAANI_DIR", vaani_dir)
@@ -69,11 +88,18 @@ def tmp_vaani_dir(tmp_path, monkeypatch):
     except ImportError:
         pass
 
-    # Patch enhance prompt paths
-    try:
-        import vaani.enhance
-        monkeypatch.setattr("vaani.enhance._USER_PROMPTS", vaani_dir / "prompts")
-    except ImportError:
-        pass
+    # The pending-recording path is fixed at vaani.main import; redirect it so
+    # a pipeline test never deletes a real ~/.vaani/pending/last_recording.wav
+    if "vaani.main" in sys.modules:
+        monkeypatch.setattr(
+            "vaani.main.PENDING_PATH", vaani_dir / "pending" / "last_recording.wav"
+        )
+
+    # Patch enhance prompt paths if it has been (fully) imported; a later
+    # import derives them from the VAANI_DIR patched above
+    enhance = sys.modules.get("vaani.enhance")
+    if hasattr(enhance, "_assemble_system_prompt"):
+        monkeypatch.setattr(enhance, "_USER_PROMPTS", vaani_dir / "prompts")
+        enhance._assemble_system_prompt.cache_clear()
 
     return vaani_dir
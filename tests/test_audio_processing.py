@@ -8,6 +8,40 @@ import numpy as np
 import pytest
 import soundfile as sf
 
+# Seeded noise built once for the module; tests take views, or copies where
+# the code under test works in place. Read-only, so a stray in-place write
+# raises instead of leaking into later tests.
+_RNG = np.random.default_rng(0)
+_AUDIO_16K = _RNG.standard_normal(16000, dtype=np.float32)
+_AUDIO_8K = _RNG.standard_normal(8000, dtype=np.float32)
+_CHUNK_512 = _RNG.standard_normal((512, 1), dtype=np.float32)
+for _shared in (_AUDIO_16K, _AUDIO_8K, _CHUNK_512):
+    _shared.setflags(write=False)
+
+
+# ---------------------------------------------------------------------------
+# list_microphones
+# ---------------------------------------------------------------------------
+
+class TestListMicrophones:
+    def test_inputs_only_with_default_flagged(self):
+        from vaani.audio import list_microphones
+        devices = [
+            {"name": "Speakers", "max_input_channels": 0},
+            {"name": "Built-in Mic", "max_input_channels": 1},
+            {"name": "USB Mic", "max_input_channels": 2},
+        ]
+        with patch("vaani.audio.sd") as mock_sd:
+            mock_sd.query_devices.return_value = devices
+            mock_sd.default.device = [2, 0]  # sounddevice's pair is list-like, not a tuple
+            mics = list_microphones()
+
+        assert [(m["index"], m["name"], m["is_default"]) for m in mics] == [
+            (1, "Built-in Mic", False),
+            (2, "USB Mic", True),
+        ]
+        mock_sd.query_devices.assert_called_once_with()
+
 
 # ---------------------------------------------------------------------------
 # normalize_gain
@@ -45,6 +79,34 @@ class TestNormalizeGain:
         result = normalize_gain(silent)
         np.testing.assert_array_equal(result, silent)
 
+    def test_audio_near_target_returned_unchanged(self):
+        from vaani.audio import normalize_gain
+        at_target = np.full(1600, 0.1, dtype=np.float32)  # exactly -20 dBFS RMS
+        result = normalize_gain(at_target * 1.05, target_dbfs=-20.0)  # +0.4 dB
+        np.testing.assert_array_equal(result, at_target * 1.05)
+
+    def test_default_leaves_input_untouched(self):
+        from vaani.audio import normalize_gain
+        quiet = np.full(1600, 0.001, dtype=np.float32)
+        normalize_gain(quiet, target_dbfs=-20.0)
+        assert np.all(quiet == np.float32(0.001))
+
+    def test_inplace_reuses_input_buffer(self):
+        from vaani.audio import normalize_gain
+        quiet = np.full(1600, 0.001, dtype=np.float32)
+        result = normalize_gain(quiet, target_dbfs=-20.0, inplace=True)
+        assert result is quiet
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, 0.1, rtol=1e-4)
+
+    def test_inplace_read_only_input_is_copied(self):
+        from vaani.audio import normalize_gain
+        quiet = np.full(1600, 0.001, dtype=np.float32)
+        quiet.flags.writeable = False
+        result = normalize_gain(quiet, target_dbfs=-20.0, inplace=True)
+        assert result is not quiet
+        assert np.all(quiet == np.float32(0.001))
+
 
 # ---------------------------------------------------------------------------
 # encode_wav
@@ -53,13 +115,13 @@ class TestNormalizeGain:
 class TestEncodeWav:
     def test_produces_valid_wav_bytes(self):
         from vaani.audio import encode_wav
-        audio = np.random.randn(16000).astype(np.float32) * 0.5
+        audio = _AUDIO_16K * 0.5
         wav = encode_wav(audio, sample_rate=16000)
         assert wav[:4] == b"RIFF"
 
     def test_round_trip(self):
         from vaani.audio import encode_wav
-        audio = np.random.randn(16000).astype(np.float32) * 0.3
+        audio = _AUDIO_16K * 0.3
         wav = encode_wav(audio, sample_rate=16000)
         data, sr = sf.read(io.BytesIO(wav), dtype="float32")
         assert sr == 16000
@@ -67,7 +129,7 @@ class TestEncodeWav:
 
     def test_correct_sample_rate(self):
         from vaani.audio import encode_wav
-        audio = np.random.randn(8000).astype(np.float32) * 0.5
+        audio = _AUDIO_8K * 0.5
         wav = encode_wav(audio, sample_rate=8000)
         _, sr = sf.read(io.BytesIO(wav), dtype="float32")
         assert sr == 8000
@@ -78,44 +140,127 @@ class TestEncodeWav:
         wav = encode_wav(empty, sample_rate=16000)
         assert wav[:4] == b"RIFF"
 
+    def test_samples_scaled_and_clipped_to_int16(self):
+        from vaani.audio import encode_wav
+        audio = np.array([0.0, 0.5, -0.5, 1.5, -2.0], dtype=np.float32)
+        wav = encode_wav(audio, sample_rate=16000)
+        assert len(wav) == 44 + 2 * len(audio)
+        samples = np.frombuffer(wav[44:], dtype="<i2")
+        np.testing.assert_array_equal(samples, [0, 16384, -16384, 32767, -32768])
+
+    def test_write_wav_matches_encode_wav(self, tmp_path):
+        from vaani.audio import encode_wav, write_wav
+        audio = _AUDIO_16K[:4000] * 0.3
+        write_wav(tmp_path / "out.wav", audio, sample_rate=16000)
+        assert (tmp_path / "out.wav").read_bytes() == encode_wav(audio, sample_rate=16000)
+
+    def test_wav_duration(self):
+        from vaani.audio import encode_wav, wav_duration
+        wav = encode_wav(np.zeros(8000, dtype=np.float32), sample_rate=16000)
+        assert wav_duration(wav, sample_rate=16000) == 0.5
+
 
 # ---------------------------------------------------------------------------
 # trim_silence (mock VAD model)
 # ---------------------------------------------------------------------------
 
+def _fake_vad(prob):
+    """Build a fake Silero model whose audio_forward yields one prob per 512-sample chunk."""
+    import torch
+
+    fake_model = MagicMock()
+
+    def audio_forward(tensor, sample_rate):
+        probs = prob if isinstance(prob, list) else [prob] * (len(tensor) // 512)
+        return torch.tensor([probs])
+
+    fake_model.audio_forward.side_effect = audio_forward
+    return fake_model
+
+
 class TestTrimSilence:
     @pytest.fixture(autouse=True)
     def _mock_vad(self, monkeypatch):
         """Patch VAD model to return predetermined probabilities."""
         import vaani.audio
 
-        fake_model = MagicMock()
         # Default: return high probability for all chunks
-        fake_model.return_value.item.return_value = 0.9
-        fake_model.reset_states = MagicMock()
-
+        fake_model = _fake_vad(0.9)
         monkeypatch.setattr("vaani.audio._vad_model", fake_model)
         self.fake_model = fake_model
 
     def test_speech_detected_returns_nonempty(self):
         from vaani.audio import trim_silence
-        audio = np.random.randn(16000).astype(np.float32)
+        audio = _AUDIO_16K.copy()  # torch.from_numpy warns on read-only arrays
         result = trim_silence(audio, sample_rate=16000, threshold=0.3)
         assert len(result) > 0
 
-    def test_no_speech_returns_empty(self):
+    def test_no_speech_returns_empty(self, monkeypatch):
         from vaani.audio import trim_silence
-        self.fake_model.return_value.item.return_value = 0.0
-        audio = np.random.randn(16000).astype(np.float32)
+        monkeypatch.setattr("vaani.audio._vad_model", _fake_vad(0.0))
+        audio = _AUDIO_16K.copy()
         result = trim_silence(audio, sample_rate=16000, threshold=0.3)
         assert len(result) == 0
 
+    def test_single_inference_call_per_recording(self):
+        from vaani.audio import trim_silence
+        audio = _AUDIO_16K.copy()
+        trim_silence(audio, sample_rate=16000, threshold=0.3)
+        self.fake_model.audio_forward.assert_called_once()
+        # Trailing partial chunk (16000 % 512 samples) is not sent to the model
+        assert len(self.fake_model.audio_forward.call_args.args[0]) == 31 * 512
+
+    def test_shorter_than_one_chunk_returns_empty(self):
+        from vaani.audio import trim_silence
+        result = trim_silence(np.ones(100, dtype=np.float32))
+        assert len(result) == 0
+        self.fake_model.audio_forward.assert_not_called()
+
+    def test_gap_between_speech_regions_is_dropped(self, monkeypatch):
+        from vaani.audio import trim_silence
+        # 31 chunks of 512: speech in chunk 0 and chunk 9 only
+        probs = [0.9] + [0.0] * 8 + [0.9] + [0.0] * 21
+        monkeypatch.setattr("vaani.audio._vad_model", _fake_vad(probs))
+        audio = np.arange(16000, dtype=np.float32)
+        result = trim_silence(audio, sample_rate=16000, threshold=0.3)
+        # Each speech chunk keeps one chunk of context before and after
+        np.testing.assert_array_equal(
+            result, np.concatenate([audio[0:1024], audio[4096:5632]])
+        )
+
     def test_empty_input(self):
         from vaani.audio import trim_silence
         result = trim_silence(np.array([], dtype=np.float32))
         assert len(result) == 0
 
 
+class TestLoadVad:
+    def test_model_warmed_up_before_publish(self, monkeypatch):
+        import vaani.audio
+
+        fake_model = _fake_vad(0.0)
+        monkeypatch.setattr("vaani.audio._vad_model", None)
+        monkeypatch.setattr("silero_vad.load_silero_vad", lambda: fake_model)
+
+        vaani.audio._load_vad()
+
+        assert vaani.audio._vad_model is fake_model
+        fake_model.eval.assert_called_once()
+        assert fake_model.audio_forward.call_count == vaani.audio._VAD_WARMUP_RUNS
+
+    def test_inference_pinned_to_one_thread(self, monkeypatch):
+        import vaani.audio
+
+        set_num_threads = MagicMock()
+        monkeypatch.setattr("vaani.audio._vad_model", None)
+        monkeypatch.setattr("silero_vad.load_silero_vad", lambda: _fake_vad(0.0))
+        monkeypatch.setattr("torch.set_num_threads", set_num_threads)
+
+        vaani.audio._load_vad()
+
+        set_num_threads.assert_called_once_with(1)
+
+
 # ---------------------------------------------------------------------------
 # process_audio
 # ---------------------------------------------------------------------------
@@ -124,21 +269,17 @@ class TestProcessAudio:
     @pytest.fixture(autouse=True)
     def _mock_vad(self, monkeypatch):
         import vaani.audio
-        fake_model = MagicMock()
-        fake_model.return_value.item.return_value = 0.0  # no speech
-        fake_model.reset_states = MagicMock()
-        monkeypatch.setattr("vaani.audio._vad_model", fake_model)
-        self.fake_model = fake_model
+        monkeypatch.setattr("vaani.audio._vad_model", _fake_vad(0.0))  # no speech
 
     def test_returns_none_when_no_speech(self):
         from vaani.audio import process_audio
-        audio = np.random.randn(16000).astype(np.float32)
+        audio = _AUDIO_16K.copy()
         assert process_audio(audio, sample_rate=16000) is None
 
-    def test_returns_wav_bytes_when_speech(self):
+    def test_returns_wav_bytes_when_speech(self, monkeypatch):
         from vaani.audio import process_audio
-        self.fake_model.return_value.item.return_value = 0.9
-        audio = np.random.randn(16000).astype(np.float32) * 0.1
+        monkeypatch.setattr("vaani.audio._vad_model", _fake_vad(0.9))
+        audio = _AUDIO_16K * 0.1
         result = process_audio(audio, sample_rate=16000, vad_threshold=0.3)
         assert result is not None
         assert result[:4] == b"RIFF"
@@ -154,11 +295,29 @@ class TestAudioRecorderCallback:
         rec = AudioRecorder(sample_rate=16000)
         rec._recording.set()  # simulate recording state
 
-        chunk = np.random.randn(512, 1).astype(np.float32)
+        chunk = _CHUNK_512
         rec._audio_callback(chunk, 512, None, None)
         rec._audio_callback(chunk, 512, None, None)
 
-        assert len(rec._chunks) == 2
+        audio = rec.stop()
+        assert audio.shape == (1024,)
+        np.testing.assert_array_equal(audio[512:], chunk[:, 0])
+
+    def test_buffer_grows_past_initial_capacity(self, monkeypatch):
+        from vaani.audio import AudioRecorder
+        monkeypatch.setattr(AudioRecorder, "INITIAL_BUFFER_SECONDS", 1)
+        monkeypatch.setattr("vaani.audio.sd.InputStream", MagicMock())
+        rec = AudioRecorder(sample_rate=1024)
+        rec.start()  # allocates a 1024-sample buffer
+        initial = rec._buf
+
+        chunks = [np.full((512, 1), i, dtype=np.float32) for i in range(10)]
+        for chunk in chunks:
+            rec._audio_callback(chunk, 512, None, None)
+
+        assert rec._buf is not initial and len(rec._buf) > len(initial)
+        audio = rec.stop()
+        np.testing.assert_array_equal(audio, np.concatenate(chunks)[:, 0])
 
     def test_current_level(self):
         from vaani.audio import AudioRecorder
@@ -180,6 +339,19 @@ class TestAudioRecorderCallback:
         from vaani.audio import AudioRecorder
         rec = AudioRecorder(sample_rate=16000)
         # _recording is NOT set
-        chunk = np.random.randn(512, 1).astype(np.float32)
+        chunk = _CHUNK_512
         rec._audio_callback(chunk, 512, None, None)
-        assert len(rec._chunks) == 0
+        assert len(rec.stop()) == 0
+
+    def test_start_does_not_requery_devices(self):
+        from vaani.audio import AudioRecorder
+        with patch("vaani.audio.sd") as mock_sd:
+            mock_sd.query_devices.return_value = {"name": "Built-in Mic", "max_input_channels": 1}
+            rec = AudioRecorder(sample_rate=16000)
+            assert rec.device_name == "Built-in Mic"
+            mock_sd.query_devices.reset_mock()
+
+            rec.start()
+            rec.stop()
+
+        mock_sd.query_devices.assert_not_called()
@@ -60,6 +60,18 @@ class TestSaveLoad:
         loaded = load_config()
         assert loaded.hotkey == "alt"
 
+    def test_python_objects_not_constructed(self, tmp_vaani_dir):
+        config_file = tmp_vaani_dir / "config.yaml"
+        config_file.write_text("hotkey: !!python/object/apply:os.getcwd []\n")
+        loaded = load_config()
+        assert loaded.hotkey == "alt"  # rejected by the safe loader, defaults used
+
+    def test_saved_file_is_plain_yaml(self, tmp_vaani_dir):
+        save_config(VaaniConfig(hotkey="<cmd>+k"))
+        data = yaml.safe_load((tmp_vaani_dir / "config.yaml").read_text())
+        assert data["hotkey"] == "<cmd>+k"
+        assert list(data) == list(VaaniConfig.model_fields)  # field order kept
+
 
 # ---------------------------------------------------------------------------
 # API key resolution priority
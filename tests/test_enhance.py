@@ -1,10 +1,15 @@
 """Tests for vaani.enhance — prompt assembly + mocked Anthropic client."""
 
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from vaani.enhance import (
+    _build_system_prompt,
+    _load_prompt_file,
+    enhance,
+)
+
 
 # ---------------------------------------------------------------------------
 # Prompt assembly
@@ -12,22 +17,20 @@ import pytest
 
 class TestPromptAssembly:
     def test_loads_project_prompt(self, tmp_vaani_dir, monkeypatch):
-        from vaani.enhance import _load_prompt_file, _BUNDLED_PROMPTS
-
         # Write a project prompt
-        project_dir = Path(_BUNDLED_PROMPTS)
-        project_dir.mkdir(parents=True, exist_ok=True)
+        project_dir = tmp_vaani_dir / "bundled"
+        monkeypatch.setattr("vaani.enhance._BUNDLED_PROMPTS", project_dir)
+        project_dir.mkdir()
         (project_dir / "test_prompt.txt").write_text("project prompt content")
 
         result = _load_prompt_file("test_prompt.txt")
         assert result == "project prompt content"
 
-    def test_user_override_wins(self, tmp_vaani_dir):
-        from vaani.enhance import _load_prompt_file, _BUNDLED_PROMPTS
-
+    def test_user_override_wins(self, tmp_vaani_dir, monkeypatch):
         # Write both project and user prompts
-        project_dir = Path(_BUNDLED_PROMPTS)
-        project_dir.mkdir(parents=True, exist_ok=True)
+        project_dir = tmp_vaani_dir / "bundled"
+        monkeypatch.setattr("vaani.enhance._BUNDLED_PROMPTS", project_dir)
+        project_dir.mkdir()
         (project_dir / "override.txt").write_text("project version")
 
         user_dir = tmp_vaani_dir / "prompts"
@@ -38,8 +41,6 @@ class TestPromptAssembly:
         assert result == "user version"
 
     def test_fallback_when_no_prompts(self, tmp_vaani_dir, monkeypatch):
-        from vaani.enhance import _build_system_prompt
-
         # Point project prompts to nonexistent dir
         monkeypatch.setattr(
             "vaani.enhance._BUNDLED_PROMPTS", tmp_vaani_dir / "nonexistent"
@@ -48,8 +49,6 @@ class TestPromptAssembly:
         assert "enhance" in result.lower() or "transcription" in result.lower()
 
     def test_mode_prompt_included(self, tmp_vaani_dir, monkeypatch):
-        from vaani.enhance import _build_system_prompt
-
         monkeypatch.setattr(
             "vaani.enhance._BUNDLED_PROMPTS", tmp_vaani_dir / "prompts"
         )
@@ -60,38 +59,72 @@ class TestPromptAssembly:
         result = _build_system_prompt("code")
         assert "code context" in result.lower()
 
+    def test_edited_user_prompt_applies_without_config_change(self, tmp_vaani_dir, monkeypatch):
+        monkeypatch.setattr(
+            "vaani.enhance._BUNDLED_PROMPTS", tmp_vaani_dir / "nonexistent"
+        )
+        context_file = tmp_vaani_dir / "prompts" / "context.txt"
+        context_file.write_text("first version")
+        assert "first version" in _build_system_prompt("casual")
+
+        context_file.write_text("second, longer version")
+        assert "second, longer version" in _build_system_prompt("casual")
+
+    def test_unchanged_prompt_files_not_reread(self, tmp_vaani_dir, monkeypatch):
+        monkeypatch.setattr(
+            "vaani.enhance._BUNDLED_PROMPTS", tmp_vaani_dir / "nonexistent"
+        )
+        (tmp_vaani_dir / "prompts" / "context.txt").write_text("context")
+        first = _build_system_prompt("casual")
+
+        load = MagicMock()
+        monkeypatch.setattr("vaani.enhance._load_prompt_file", load)
+        assert _build_system_prompt("casual") == first
+        load.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Mocked Anthropic streaming
 # ---------------------------------------------------------------------------
 
+def _fake_stream(chunks):
+    """Build a mock ``messages.stream(...)`` context manager yielding *chunks*."""
+    stream = MagicMock()
+    stream.__enter__ = MagicMock(return_value=stream)
+    stream.__exit__ = MagicMock(return_value=False)
+    stream.text_stream = iter(chunks)
+    return stream
+
+
 class TestEnhance:
+    @pytest.fixture
+    def anthropic_cls(self, mock_keyring):
+        """Patched Anthropic client class, with an API key in the keyring."""
+        mock_keyring.set_password("vaani", "anthropic_api_key", "sk-test")
+        with patch("vaani.enhance.anthropic.Anthropic") as cls:
+            yield cls
+
     def test_missing_key_raises_runtime_error(self, mock_keyring):
-        from vaani.enhance import enhance
         with pytest.raises(RuntimeError, match="Anthropic API key not found"):
             enhance("hello world")
 
     def test_empty_transcription_returned_as_is(self, mock_keyring):
-        from vaani.enhance import enhance
         mock_keyring.set_password("vaani", "anthropic_api_key", "sk-test")
         result = enhance("  ")
         assert result == "  "
 
-    @patch("vaani.enhance.anthropic.Anthropic")
-    def test_streamed_response_assembled(self, mock_anthropic_cls, mock_keyring):
-        from vaani.enhance import enhance
-
-        mock_keyring.set_password("vaani", "anthropic_api_key", "sk-test")
-
-        # Set up streaming mock
-        mock_stream = MagicMock()
-        mock_stream.__enter__ = MagicMock(return_value=mock_stream)
-        mock_stream.__exit__ = MagicMock(return_value=False)
-        mock_stream.text_stream = iter(["Hello", ", ", "world!"])
-
-        mock_client = MagicMock()
-        mock_client.messages.stream.return_value = mock_stream
-        mock_anthropic_cls.return_value = mock_client
+    def test_streamed_response_assembled(self, anthropic_cls):
+        stream = _fake_stream(["Hello", ", ", "world!"])
+        anthropic_cls.return_value.messages.stream.return_value = stream
 
         result = enhance("hello world", mode="minimal")
         assert result == "Hello, world!"
+
+    def test_client_reused_across_calls(self, anthropic_cls):
+        anthropic_cls.return_value.messages.stream.side_effect = (
+            lambda **kwargs: _fake_stream(["ok"])
+        )
+
+        enhance("hello world")
+        enhance("hello again")
+        anthropic_cls.assert_called_once_with(api_key="sk-test")
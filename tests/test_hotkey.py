@@ -1,5 +1,6 @@
 """Tests for vaani.hotkey — NSEvent-based hotkey parsing and dispatch."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,15 +14,38 @@ from vaani.hotkey import (
     _NSKeyUp,
 )
 
+_ALT = _MODIFIER_FLAGS["alt"]
+_CMD = _MODIFIER_FLAGS["cmd"]
+_CMD_SHIFT = _CMD | _MODIFIER_FLAGS["shift"]
+
+
+class _FakeEvent:
+    """Minimal stand-in for the NSEvent accessors the listener reads."""
+
+    __slots__ = ("_type", "_modifiers", "_char", "_keycode")
+
+    def __init__(self, event_type, modifiers, char, keycode):
+        self._type = event_type
+        self._modifiers = modifiers
+        self._char = char
+        self._keycode = keycode
+
+    def type(self):
+        return self._type
+
+    def modifierFlags(self):
+        return self._modifiers
+
+    def charactersIgnoringModifiers(self):
+        return self._char
+
+    def keyCode(self):
+        return self._keycode
+
 
 def _make_event(event_type, modifiers=0, char="", keycode=0):
-    """Build a minimal mock NSEvent."""
-    event = MagicMock()
-    event.type.return_value = event_type
-    event.modifierFlags.return_value = modifiers
-    event.charactersIgnoringModifiers.return_value = char
-    event.keyCode.return_value = keycode
-    return event
+    """Build a minimal fake NSEvent."""
+    return _FakeEvent(event_type, modifiers, char, keycode)
 
 
 # ---------------------------------------------------------------------------
@@ -31,17 +55,17 @@ def _make_event(event_type, modifiers=0, char="", keycode=0):
 class TestKeyParsing:
     def test_single_modifier(self):
         hl = HotkeyListener(hotkey="alt")
-        assert hl._modifier_flags == _MODIFIER_FLAGS["alt"]
+        assert hl._modifier_flags == _ALT
         assert hl._trigger_char is None
 
     def test_angle_bracket_variant(self):
         hl = HotkeyListener(hotkey="<alt>")
-        assert hl._modifier_flags == _MODIFIER_FLAGS["alt"]
+        assert hl._modifier_flags == _ALT
         assert hl._trigger_char is None
 
     def test_cmd_shift_semicolon(self):
         hl = HotkeyListener(hotkey="<cmd>+<shift>+;")
-        assert hl._modifier_flags == _MODIFIER_FLAGS["cmd"] | _MODIFIER_FLAGS["shift"]
+        assert hl._modifier_flags == _CMD_SHIFT
         assert hl._trigger_char == ";"
 
     def test_ctrl_a(self):
@@ -51,15 +75,25 @@ class TestKeyParsing:
 
     def test_space_key(self):
         hl = HotkeyListener(hotkey="<cmd>+space")
-        assert hl._modifier_flags == _MODIFIER_FLAGS["cmd"]
+        assert hl._modifier_flags == _CMD
         assert hl._trigger_char == " "
 
     def test_multiple_modifiers(self):
         hl = HotkeyListener(hotkey="<cmd>+<shift>+<alt>")
-        expected = _MODIFIER_FLAGS["cmd"] | _MODIFIER_FLAGS["shift"] | _MODIFIER_FLAGS["alt"]
+        expected = _CMD_SHIFT | _ALT
         assert hl._modifier_flags == expected
         assert hl._trigger_char is None
 
+    def test_brackets_optional_and_tolerant(self):
+        hl = HotkeyListener(hotkey="<cmd+shift>+<space>")
+        assert hl._modifier_flags == _CMD_SHIFT
+        assert hl._trigger_char == " "
+
+    def test_literal_angle_bracket_trigger(self):
+        hl = HotkeyListener(hotkey="<cmd>+<")
+        assert hl._modifier_flags == _CMD
+        assert hl._trigger_char == "<"
+
 
 # ---------------------------------------------------------------------------
 # Callback dispatch via _handle_event
@@ -70,7 +104,7 @@ class TestModifierOnlyHotkey:
         on_press = MagicMock()
         hl = HotkeyListener(hotkey="alt", on_press=on_press)
 
-        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_MODIFIER_FLAGS["alt"]))
+        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
         on_press.assert_called_once()
 
     def test_release_fires_on_release(self):
@@ -78,7 +112,7 @@ class TestModifierOnlyHotkey:
         on_release = MagicMock()
         hl = HotkeyListener(hotkey="alt", on_press=on_press, on_release=on_release)
 
-        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_MODIFIER_FLAGS["alt"]))
+        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
         hl._handle_event(_make_event(_NSFlagsChanged, modifiers=0))
 
         on_press.assert_called_once()
@@ -88,9 +122,8 @@ class TestModifierOnlyHotkey:
         on_press = MagicMock()
         hl = HotkeyListener(hotkey="alt", on_press=on_press)
 
-        mods = _MODIFIER_FLAGS["alt"]
-        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=mods))
-        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=mods))
+        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
+        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
 
         on_press.assert_called_once()
 
@@ -101,14 +134,22 @@ class TestModifierOnlyHotkey:
         hl._handle_event(_make_event(_NSFlagsChanged, modifiers=0))
         on_release.assert_not_called()
 
+    def test_ordinary_keystrokes_skip_modifier_lookup(self):
+        hl = HotkeyListener(hotkey="alt")
+
+        for event_type in (_NSKeyDown, _NSKeyUp):
+            event = MagicMock(wraps=_make_event(event_type, char="a"))
+            hl._handle_event(event)
+            event.modifierFlags.assert_not_called()
+            event.keyCode.assert_not_called()
+
 
 class TestComboHotkey:
     def test_press_fires_on_press(self):
         on_press = MagicMock()
         hl = HotkeyListener(hotkey="<cmd>+<shift>+;", on_press=on_press)
 
-        mods = _MODIFIER_FLAGS["cmd"] | _MODIFIER_FLAGS["shift"]
-        hl._handle_event(_make_event(_NSKeyDown, modifiers=mods, char=";"))
+        hl._handle_event(_make_event(_NSKeyDown, modifiers=_CMD_SHIFT, char=";"))
         on_press.assert_called_once()
 
     def test_key_release_fires_on_release(self):
@@ -116,9 +157,8 @@ class TestComboHotkey:
         on_release = MagicMock()
         hl = HotkeyListener(hotkey="<cmd>+<shift>+;", on_press=on_press, on_release=on_release)
 
-        mods = _MODIFIER_FLAGS["cmd"] | _MODIFIER_FLAGS["shift"]
-        hl._handle_event(_make_event(_NSKeyDown, modifiers=mods, char=";"))
-        hl._handle_event(_make_event(_NSKeyUp, modifiers=mods, char=";"))
+        hl._handle_event(_make_event(_NSKeyDown, modifiers=_CMD_SHIFT, char=";"))
+        hl._handle_event(_make_event(_NSKeyUp, modifiers=_CMD_SHIFT, char=";"))
 
         on_press.assert_called_once()
         on_release.assert_called_once()
@@ -128,14 +168,14 @@ class TestComboHotkey:
         hl = HotkeyListener(hotkey="<cmd>+<shift>+;", on_press=on_press)
 
         # Only cmd, missing shift
-        hl._handle_event(_make_event(_NSKeyDown, modifiers=_MODIFIER_FLAGS["cmd"], char=";"))
+        hl._handle_event(_make_event(_NSKeyDown, modifiers=_CMD, char=";"))
         on_press.assert_not_called()
 
     def test_wrong_char_does_not_trigger(self):
         on_press = MagicMock()
         hl = HotkeyListener(hotkey="<cmd>+;", on_press=on_press)
 
-        hl._handle_event(_make_event(_NSKeyDown, modifiers=_MODIFIER_FLAGS["cmd"], char="a"))
+        hl._handle_event(_make_event(_NSKeyDown, modifiers=_CMD, char="a"))
         on_press.assert_not_called()
 
 
@@ -146,7 +186,7 @@ class TestEscapeCancel:
         hl = HotkeyListener(hotkey="alt", on_press=on_press, on_cancel=on_cancel)
 
         # Press hotkey
-        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_MODIFIER_FLAGS["alt"]))
+        hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
         # Escape while pressed
         hl._handle_event(_make_event(_NSKeyDown, keycode=_ESC_KEYCODE))
 
@@ -158,8 +198,7 @@ class TestEscapeCancel:
         on_cancel = MagicMock()
         hl = HotkeyListener(hotkey="<cmd>+;", on_press=on_press, on_cancel=on_cancel)
 
-        mods = _MODIFIER_FLAGS["cmd"]
-        hl._handle_event(_make_event(_NSKeyDown, modifiers=mods, char=";"))
+        hl._handle_event(_make_event(_NSKeyDown, modifiers=_CMD, char=";"))
         hl._handle_event(_make_event(_NSKeyDown, keycode=_ESC_KEYCODE))
 
         on_cancel.assert_called_once()
@@ -186,8 +225,9 @@ class TestStartStop:
             hl = HotkeyListener(hotkey="alt")
             hl.start()
 
-        mock_nsevent.addGlobalMonitorForEventsMatchingMask_handler_.assert_called_once()
-        assert hl._monitor is mock_monitor
+            mock_nsevent.addGlobalMonitorForEventsMatchingMask_handler_.assert_called_once()
+            assert hl._monitor is mock_monitor
+            hl.stop()
 
     def test_stop_removes_monitor(self):
         mock_nsevent = MagicMock()
@@ -210,3 +250,48 @@ class TestStartStop:
             hl.stop()
 
         mock_nsevent.removeMonitor_.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Callback dispatch thread
+# ---------------------------------------------------------------------------
+
+class TestDispatchThread:
+    def test_callbacks_run_off_the_event_thread_in_order(self):
+        calls = []
+        done = threading.Event()
+
+        def record(name):
+            def callback():
+                calls.append((name, threading.current_thread()))
+                if name == "release":
+                    done.set()
+            return callback
+
+        with patch("vaani.hotkey._NSEvent", MagicMock()):
+            hl = HotkeyListener(hotkey="alt", on_press=record("press"), on_release=record("release"))
+            hl.start()
+            hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
+            hl._handle_event(_make_event(_NSFlagsChanged, modifiers=0))
+            assert done.wait(timeout=2)
+            worker = hl._worker
+            hl.stop()
+
+        assert [name for name, _ in calls] == ["press", "release"]
+        assert all(thread is worker for _, thread in calls)
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+
+    def test_callback_error_does_not_stop_dispatch(self):
+        released = threading.Event()
+        with patch("vaani.hotkey._NSEvent", MagicMock()):
+            hl = HotkeyListener(
+                hotkey="alt",
+                on_press=MagicMock(side_effect=RuntimeError("boom")),
+                on_release=released.set,
+            )
+            hl.start()
+            hl._handle_event(_make_event(_NSFlagsChanged, modifiers=_ALT))
+            hl._handle_event(_make_event(_NSFlagsChanged, modifiers=0))
+            assert released.wait(timeout=2)
+            hl.stop()
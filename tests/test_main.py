@@ -1,5 +1,6 @@
 """Tests for vaani.main — VaaniApp orchestrator + CLI commands."""
 
+import os
 import threading
 from unittest.mock import MagicMock, patch, PropertyMock
 
@@ -11,6 +12,40 @@ from vaani.config import VaaniConfig
 from vaani.main import VaaniApp, cli
 from vaani.state import AppState
 
+# One second of synthetic input, built once; read-only so a pipeline step
+# that scribbles on the caller's buffer fails loudly.
+_NOISE_1S = np.random.default_rng(0).standard_normal(16000, dtype=np.float32)
+_NOISE_1S.setflags(write=False)
+_SINE_1S = (np.sin(2 * np.pi * 440 * np.linspace(0, 1, 16000, dtype=np.float32)) * 0.5
+            ).astype(np.float32)
+_SINE_1S.setflags(write=False)
+_SILENCE_1S = np.zeros(16000, dtype=np.float32)
+_SILENCE_1S.setflags(write=False)
+
+
+class _StubRecorder:
+    """Stands in for AudioRecorder where no test inspects the calls."""
+
+    current_level = 0.5
+
+    def start(self):
+        pass
+
+    def stop(self):
+        return _SILENCE_1S
+
+    def cancel(self):
+        pass
+
+
+def _make_app(prewarmed: bool) -> VaaniApp:
+    """A VaaniApp on default config with a stub recorder attached."""
+    app = VaaniApp(VaaniConfig())
+    app._recorder = _StubRecorder()
+    if prewarmed:
+        app._prewarm_done.set()
+    return app
+
 
 # ---------------------------------------------------------------------------
 # VaaniApp state transitions
@@ -19,14 +54,7 @@ from vaani.state import AppState
 class TestVaaniAppStates:
     @pytest.fixture
     def app(self):
-        config = VaaniConfig()
-        app = VaaniApp(config)
-        app._prewarm_done.set()
-        mock_recorder = MagicMock()
-        mock_recorder.current_level = 0.5
-        mock_recorder.stop.return_value = np.zeros(16000, dtype=np.float32)
-        app._recorder = mock_recorder
-        return app
+        return _make_app(prewarmed=True)
 
     def test_start_recording(self, app):
         app.start_recording()
@@ -54,9 +82,64 @@ class TestVaaniAppStates:
         # Should still be processing
         assert app.state.is_processing
 
+    def test_stop_cancels_auto_stop_timer(self, app):
+        app.start_recording()
+        timer = app._auto_stop_timer
+        assert timer.is_alive()
+        app.cancel_recording()
+        timer.join(timeout=1)
+        assert not timer.is_alive()
+        assert app._auto_stop_timer is None
+
+    def test_pipeline_runs_on_shared_worker(self, app):
+        threads = []
+        done = threading.Event()
+
+        def fake_process(audio):
+            threads.append(threading.current_thread())
+            done.set()
+
+        with patch.object(app, "_process_audio", side_effect=fake_process):
+            app.start_recording()
+            app.stop_recording()
+            assert done.wait(timeout=1)
+
+        assert threads[0].name.startswith("vaani-pipeline")
+        app.close()
+
+    def test_concurrent_get_recorder_builds_one(self):
+        app = VaaniApp(VaaniConfig())
+        start = threading.Barrier(4)
+        results = []
+
+        def build(**kwargs):
+            threading.Event().wait(0.05)  # widen the race window
+            return MagicMock()
+
+        def get():
+            start.wait()
+            results.append(app._get_recorder())
+
+        with patch("vaani.audio.AudioRecorder", side_effect=build) as mock_cls:
+            threads = [threading.Thread(target=get) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=2)
+
+        mock_cls.assert_called_once()
+        assert all(r is results[0] for r in results)
+
+    def test_auto_stop_fires_after_max_length(self, app):
+        app.config.max_recording_seconds = 0.01
+        stopped = threading.Event()
+        with patch.object(app, "stop_recording", side_effect=stopped.set):
+            app.start_recording()
+            assert stopped.wait(timeout=1)
+
 
 # ---------------------------------------------------------------------------
-# Pipeline (_process_audio) — patches target source modules (local imports)
+# Pipeline (_process_audio) — patches target source modules (resolved on first use)
 # ---------------------------------------------------------------------------
 
 class TestProcessAudio:
@@ -69,11 +152,10 @@ class TestProcessAudio:
     @patch("vaani.enhance.enhance")
     @patch("vaani.transcribe.transcribe")
     @patch("vaani.audio.process_audio")
-    @patch("vaani.audio.encode_wav")
+    @patch("vaani.audio.write_wav")
     def test_full_pipeline_success(
-        self, mock_encode, mock_process, mock_transcribe, mock_enhance, mock_paste, app
+        self, mock_write_wav, mock_process, mock_transcribe, mock_enhance, mock_paste, app
     ):
-        mock_encode.return_value = b"wav"
         mock_process.return_value = b"processed wav"
         mock_transcribe.return_value = "hello world"
         mock_enhance.return_value = "Hello, world!"
@@ -81,55 +163,92 @@ class TestProcessAudio:
         app.state.transition(AppState.RECORDING)
         app.state.transition(AppState.PROCESSING)
 
-        audio = np.random.randn(16000).astype(np.float32)
-        app._process_audio(audio)
+        app._process_audio(_NOISE_1S)
 
+        mock_write_wav.assert_called_once()  # pending copy of the raw recording
         mock_transcribe.assert_called_once()
         mock_enhance.assert_called_once()
         mock_paste.assert_called_once_with("Hello, world!", app.config.paste_restore_delay_ms)
         assert app.state.is_idle
 
-    @patch("vaani.audio.encode_wav")
+    @patch("vaani.output.paste_text")
+    @patch("vaani.enhance.enhance", return_value="Hello, world!")
+    @patch("vaani.transcribe.transcribe", return_value="hello world")
+    @patch("vaani.audio.process_audio", return_value=b"processed wav")
+    def test_pending_recording_removed_on_success(
+        self, mock_process, mock_transcribe, mock_enhance, mock_paste, app, tmp_vaani_dir
+    ):
+        from vaani.audio import write_wav
+
+        pending = tmp_vaani_dir / "pending" / "last_recording.wav"  # redirected by the fixture
+        with patch("vaani.audio.write_wav", side_effect=write_wav) as mock_write_wav:
+            app._process_audio(np.full(16000, 0.1, dtype=np.float32))
+
+        mock_write_wav.assert_called_once()
+        assert mock_write_wav.call_args.args[0] == pending
+        assert not pending.exists()
+
+    @patch("vaani.audio.write_wav")
     @patch("vaani.audio.process_audio")
-    def test_no_speech_returns_to_idle(self, mock_process, mock_encode, app):
-        mock_encode.return_value = b"wav"
+    def test_no_speech_returns_to_idle(self, mock_process, mock_write_wav, app):
         mock_process.return_value = None  # no speech
 
+        app.state.transition(AppState.RECORDING)
+        app.state.transition(AppState.PROCESSING)
+        app._process_audio(np.full(16000, 0.1, dtype=np.float32))
+
+        mock_process.assert_called_once()
+        assert app.state.is_idle
+
+    @patch("vaani.audio.write_wav")
+    @patch("vaani.audio.process_audio")
+    def test_short_tap_skips_vad(self, mock_process, mock_write_wav, app):
+        app.state.transition(AppState.RECORDING)
+        app.state.transition(AppState.PROCESSING)
+        app._process_audio(np.full(1600, 0.1, dtype=np.float32))  # 100 ms
+
+        mock_process.assert_not_called()
+        mock_write_wav.assert_not_called()
+        assert app.state.is_idle
+
+    @patch("vaani.audio.write_wav")
+    @patch("vaani.audio.process_audio")
+    def test_silent_recording_skips_vad(self, mock_process, mock_write_wav, app):
         app.state.transition(AppState.RECORDING)
         app.state.transition(AppState.PROCESSING)
         app._process_audio(np.zeros(16000, dtype=np.float32))
 
+        mock_process.assert_not_called()
+        mock_write_wav.assert_not_called()
         assert app.state.is_idle
 
-    @patch("vaani.audio.encode_wav")
+    @patch("vaani.audio.write_wav")
     @patch("vaani.audio.process_audio")
     @patch("vaani.transcribe.transcribe")
     def test_junk_transcription_returns_to_idle(
-        self, mock_transcribe, mock_process, mock_encode, app
+        self, mock_transcribe, mock_process, mock_write_wav, app
     ):
-        mock_encode.return_value = b"wav"
         mock_process.return_value = b"wav bytes"
         mock_transcribe.return_value = "ok"  # too short (<3 chars stripped)
 
         app.state.transition(AppState.RECORDING)
         app.state.transition(AppState.PROCESSING)
-        app._process_audio(np.zeros(16000, dtype=np.float32))
+        app._process_audio(np.full(16000, 0.1, dtype=np.float32))
 
         assert app.state.is_idle
 
-    @patch("vaani.audio.encode_wav")
+    @patch("vaani.audio.write_wav")
     @patch("vaani.audio.process_audio")
     @patch("vaani.transcribe.transcribe")
     def test_pipeline_error_returns_to_idle(
-        self, mock_transcribe, mock_process, mock_encode, app
+        self, mock_transcribe, mock_process, mock_write_wav, app
     ):
-        mock_encode.return_value = b"wav"
         mock_process.return_value = b"wav bytes"
         mock_transcribe.side_effect = RuntimeError("API error")
 
         app.state.transition(AppState.RECORDING)
         app.state.transition(AppState.PROCESSING)
-        app._process_audio(np.zeros(16000, dtype=np.float32))
+        app._process_audio(np.full(16000, 0.1, dtype=np.float32))
 
         assert app.state.is_idle
 
@@ -144,26 +263,21 @@ class TestIntegration:
     @patch("vaani.enhance.enhance")
     @patch("vaani.transcribe.transcribe")
     @patch("vaani.audio.process_audio")
-    @patch("vaani.audio.encode_wav")
+    @patch("vaani.audio.write_wav")
     def test_end_to_end_pipeline(
-        self, mock_encode, mock_process, mock_transcribe, mock_enhance, mock_paste, tmp_vaani_dir
+        self, mock_write_wav, mock_process, mock_transcribe, mock_enhance, mock_paste, tmp_vaani_dir
     ):
         """Synthetic audio -> mocked VAD -> mocked Whisper -> mocked Claude -> mocked paste."""
         config = VaaniConfig()
         app = VaaniApp(config)
 
-        # Simulate a sine-wave audio
-        t = np.linspace(0, 1, 16000, dtype=np.float32)
-        audio = (np.sin(2 * np.pi * 440 * t) * 0.5).astype(np.float32)
-
-        mock_encode.return_value = b"wav"
         mock_process.return_value = b"processed wav bytes"
         mock_transcribe.return_value = "this is a test recording"
         mock_enhance.return_value = "This is a test recording."
 
         app.state.transition(AppState.RECORDING)
         app.state.transition(AppState.PROCESSING)
-        app._process_audio(audio)
+        app._process_audio(_SINE_1S)  # a 440 Hz tone
 
         # Verify pipeline executed in order
         mock_process.assert_called_once()
@@ -185,14 +299,16 @@ class TestIntegration:
 # ---------------------------------------------------------------------------
 
 class TestCLI:
-    def test_cli_help(self):
-        runner = CliRunner()
+    @pytest.fixture
+    def runner(self):
+        return CliRunner()
+
+    def test_cli_help(self, runner):
         result = runner.invoke(cli, ["--help"])
         assert result.exit_code == 0
         assert "Vaani" in result.output
 
-    def test_setup_command_prompts_for_keys(self, tmp_vaani_dir, mock_keyring):
-        runner = CliRunner()
+    def test_setup_command_prompts_for_keys(self, runner, tmp_vaani_dir, mock_keyring):
         result = runner.invoke(cli, ["setup"], input="sk-openai-test\nsk-anthropic-test\n")
         assert result.exit_code == 0
         assert "Setup complete" in result.output
@@ -201,16 +317,16 @@ class TestCLI:
     @patch("vaani.main.load_config")
     @patch("vaani.main.get_openai_key", return_value="sk-test")
     @patch("vaani.main.get_anthropic_key", return_value="sk-test")
-    def test_start_foreground(self, mock_ak, mock_ok, mock_load, mock_app_cls):
+    def test_start_foreground(self, mock_ak, mock_ok, mock_load, mock_app_cls, runner, pid_file):
         config = VaaniConfig(onboarding_completed=True)
         mock_load.return_value = config
         mock_app = MagicMock()
         mock_app_cls.return_value = mock_app
 
-        runner = CliRunner()
         result = runner.invoke(cli, ["start", "--foreground"])
         assert result.exit_code == 0
         mock_app.run.assert_called_once()
+        assert pid_file.read_text() == str(os.getpid())
 
 
 # ---------------------------------------------------------------------------
@@ -222,52 +338,257 @@ class TestPrewarmGate:
 
     @pytest.fixture
     def app(self):
-        config = VaaniConfig()
-        app = VaaniApp(config)
-        mock_recorder = MagicMock()
-        mock_recorder.current_level = 0.5
-        mock_recorder.stop.return_value = np.zeros(16000, dtype=np.float32)
-        app._recorder = mock_recorder
-        return app
+        return _make_app(prewarmed=False)
+
+    @pytest.fixture
+    def loaders(self):
+        """The VAD and NER model loaders, patched out for the _prewarm() tests."""
+        with patch("vaani.audio._load_vad") as load_vad, \
+             patch("vaani.output._load_nlp") as load_nlp:
+            yield load_vad, load_nlp
 
     def test_recording_blocked_until_prewarm_done(self, app):
         """start_recording should not transition to RECORDING while prewarm is pending."""
-        app.PREWARM_TIMEOUT = 0.1
+        app.PREWARM_TIMEOUT = 0
         app.start_recording()
         assert app.state.is_idle, "Recording must not start before prewarm completes"
 
+    def test_loading_notification_shown_before_waiting(self, app):
+        app.PREWARM_TIMEOUT = 0
+        app.menubar = MagicMock()
+        app.start_recording()
+        messages = [c.args[1] for c in app.menubar.show_notification.call_args_list]
+        assert messages[0] == "Models still loading, please wait..."
+        assert len(messages) == 2  # then the timeout notice
+
+    def test_no_notification_once_prewarmed(self, app):
+        app._prewarm_done.set()
+        app.menubar = MagicMock()
+        app.start_recording()
+        app.menubar.show_notification.assert_not_called()
+
     def test_recording_allowed_after_prewarm(self, app):
         """Once prewarm is signalled, recording should proceed normally."""
         app._prewarm_done.set()
         app.start_recording()
         assert app.state.is_recording
 
-    def test_prewarm_sets_event_on_success(self, app):
-        with patch("vaani.audio._load_vad"), \
-             patch("vaani.output._load_nlp"):
-            app._prewarm()
+    def test_prewarm_sets_event_on_success(self, app, loaders):
+        app._prewarm()
         assert app._prewarm_done.is_set()
 
-    def test_prewarm_sets_event_on_failure(self, app):
+    def test_prewarm_sets_event_on_failure(self, app, loaders):
         """Even if a model fails to load, the event fires so the app doesn't hang."""
-        with patch("vaani.audio._load_vad", side_effect=RuntimeError("download failed")):
-            app._prewarm()
+        load_vad, _ = loaders
+        load_vad.side_effect = RuntimeError("download failed")
+        app._prewarm()
         assert app._prewarm_done.is_set()
 
-    @patch("vaani.output._load_nlp")
-    @patch("vaani.audio._load_vad")
-    def test_prewarm_loads_vad_and_nlp(self, mock_vad, mock_nlp, app):
+    def test_prewarm_loads_vad_and_nlp(self, app, loaders):
+        load_vad, load_nlp = loaders
+        app._prewarm()
+        load_vad.assert_called_once()
+        load_nlp.assert_called_once()
+
+    def test_prewarm_imports_api_clients(self, app, loaders, monkeypatch):
+        import sys
+        import vaani
+        for name in ("enhance", "transcribe"):
+            monkeypatch.delitem(sys.modules, f"vaani.{name}", raising=False)
+            monkeypatch.delattr(vaani, name, raising=False)
         app._prewarm()
-        mock_vad.assert_called_once()
-        mock_nlp.assert_called_once()
+        assert "vaani.enhance" in sys.modules
+        assert "vaani.transcribe" in sys.modules
+        assert app._pipeline is not None
+
+    @patch("vaani.enhance.anthropic.Anthropic")
+    @patch("vaani.transcribe.OpenAI")
+    def test_prewarm_builds_api_clients(
+        self, mock_openai_cls, mock_anthropic_cls, app, loaders, mock_keyring
+    ):
+        mock_keyring.set_password("vaani", "openai_api_key", "sk-openai")
+        mock_keyring.set_password("vaani", "anthropic_api_key", "sk-anthropic")
 
-    def test_delayed_prewarm_unblocks_recording(self, app):
-        """Simulate prewarm finishing after a short delay — recording should proceed."""
-        def delayed_set():
-            import time
-            time.sleep(0.05)
-            app._prewarm_done.set()
+        app._prewarm()
+
+        mock_openai_cls.assert_called_once_with(api_key="sk-openai")
+        mock_anthropic_cls.assert_called_once()
+        mock_openai_cls.return_value.models.list.assert_not_called()
 
-        threading.Thread(target=delayed_set, daemon=True).start()
+    def test_delayed_prewarm_unblocks_recording(self, app):
+        """Prewarm finishing after the press was held — recording should proceed."""
+        app.menubar = MagicMock()
+        # Finish prewarm from the "still loading" notice, i.e. after the gate
+        # was found closed and just before the wait
+        app.menubar.show_notification.side_effect = lambda *a: app._prewarm_done.set()
         app.start_recording()
         assert app.state.is_recording
+
+
+# ---------------------------------------------------------------------------
+# Config hot-reload
+# ---------------------------------------------------------------------------
+
+class TestConfigReload:
+    @pytest.fixture
+    def app(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("active_mode: minimal\n")
+        monkeypatch.setattr("vaani.main.CONFIG_FILE", config_file)
+        app = VaaniApp(VaaniConfig())
+        app.config_file = config_file
+        return app
+
+    def _touch(self, app):
+        st = app.config_file.stat()
+        os.utime(app.config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    @patch("vaani.main.load_config", return_value=VaaniConfig())
+    def test_change_picked_up(self, mock_load, app):
+        self._touch(app)
+        app._reload_config_if_changed()
+        mock_load.assert_called_once()
+
+    @patch("vaani.main.load_config", return_value=VaaniConfig())
+    def test_repeat_checks_within_ttl_skip_stat(self, mock_load, app):
+        app._reload_config_if_changed()
+        self._touch(app)
+        app._reload_config_if_changed()
+        mock_load.assert_not_called()
+
+        app._config_check_ts -= app.CONFIG_CHECK_TTL  # TTL expired
+        app._reload_config_if_changed()
+        mock_load.assert_called_once()
+
+    def test_in_process_save_bypasses_ttl(self, tmp_vaani_dir, monkeypatch):
+        import vaani.config
+        from vaani.config import save_config
+        monkeypatch.setattr("vaani.main.CONFIG_FILE", vaani.config.CONFIG_FILE)
+        app = VaaniApp(VaaniConfig())
+        app._reload_config_if_changed()  # starts the TTL window
+
+        save_config(VaaniConfig(active_mode="professional"))
+        app._reload_config_if_changed()
+        assert app.config.active_mode == "professional"
+
+    @patch("vaani.main.load_config", return_value=VaaniConfig(microphone_device=3))
+    def test_recorder_reset_under_recorder_lock(self, mock_load, app):
+        reset_seen = []  # whether the recorder was reset, on lock entry and exit
+
+        class _RecordingLock:
+            def __enter__(self):
+                reset_seen.append(app._recorder is None)
+
+            def __exit__(self, *exc):
+                reset_seen.append(app._recorder is None)
+
+        app._recorder = _StubRecorder()
+        app._recorder_lock = _RecordingLock()
+        self._touch(app)
+        app._reload_config_if_changed()
+
+        assert reset_seen == [False, True]
+        assert app.config.microphone_device == 3
+
+    @patch("vaani.main.load_config", return_value=VaaniConfig())
+    def test_missing_config_file_is_not_a_change(self, mock_load, app, monkeypatch):
+        monkeypatch.setattr("vaani.main.CONFIG_FILE", app.config_file.with_name("missing.yaml"))
+        app._config_mtime = 0
+        app._reload_config_if_changed()
+        mock_load.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Logging setup
+# ---------------------------------------------------------------------------
+
+class TestSetupLogging:
+    @pytest.fixture
+    def clean_logging(self, monkeypatch):
+        import logging
+        import vaani.main
+        monkeypatch.setattr("vaani.main._log_listener", None)
+        root = logging.getLogger("vaani")
+        handlers = list(root.handlers)
+        root.handlers.clear()
+        yield
+        vaani.main._stop_logging()
+        root.handlers[:] = handlers
+
+    def test_records_written_via_queue_listener(self, tmp_path, clean_logging):
+        import logging
+        import vaani.main
+        from vaani.main import setup_logging
+
+        log_file = tmp_path / "vaani.log"
+        setup_logging(VaaniConfig(log_file=str(log_file)))
+        setup_logging(VaaniConfig(log_file=str(log_file)))  # second call is a no-op
+
+        queue_handlers = [
+            h for h in logging.getLogger("vaani").handlers
+            if isinstance(h, logging.handlers.QueueHandler)
+        ]
+        assert len(queue_handlers) == 1
+
+        logging.getLogger("vaani.test").info("hello from a worker")
+        vaani.main._stop_logging()  # flushes the queue
+        assert "hello from a worker" in log_file.read_text()
+
+
+# ---------------------------------------------------------------------------
+# Single-instance pidfile
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def pid_file(tmp_path, monkeypatch):
+    import vaani.main
+    path = tmp_path / "vaani.pid"
+    monkeypatch.setattr("vaani.main.PID_FILE", path)
+    yield path
+    if vaani.main._pid_file_fd is not None:
+        os.close(vaani.main._pid_file_fd)
+        vaani.main._pid_file_fd = None
+
+
+class TestPidFile:
+    def test_stale_pid_file_is_not_signalled(self, pid_file):
+        from vaani.main import _stop_running_instance
+        pid_file.write_text("1")  # nobody holds the lock
+        with patch("vaani.main.os.kill") as mock_kill:
+            _stop_running_instance()
+        mock_kill.assert_not_called()
+
+    def test_missing_pid_file_is_a_no_op(self, pid_file):
+        from vaani.main import _stop_running_instance
+        with patch("vaani.main.os.kill") as mock_kill:
+            _stop_running_instance()
+        mock_kill.assert_not_called()
+
+    def test_running_instance_is_terminated(self, pid_file):
+        import subprocess
+        import sys
+        from vaani.main import _claim_pid_file, _stop_running_instance
+
+        holder = subprocess.Popen(
+            [sys.executable, "-c",
+             "import fcntl, os, sys, time\n"
+             "fd = os.open(sys.argv[1], os.O_RDWR | os.O_CREAT)\n"
+             "fcntl.flock(fd, fcntl.LOCK_EX)\n"
+             "os.write(fd, str(os.getpid()).encode())\n"
+             "print('locked', flush=True)\n"
+             "time.sleep(30)\n",
+             str(pid_file)],
+            stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            assert holder.stdout.readline().strip() == "locked"
+            assert not _claim_pid_file()
+
+            _stop_running_instance()
+
+            assert holder.wait(timeout=5) != 0  # killed by SIGTERM
+            assert _claim_pid_file()
+        finally:
+            holder.kill()
+            holder.wait()
+
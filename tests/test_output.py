@@ -10,6 +10,8 @@ import pytest
 # ---------------------------------------------------------------------------
 
 class _FakeEntity:
+    __slots__ = ("text", "label_", "start_char", "end_char")
+
     def __init__(self, text, label, start_char, end_char):
         self.text = text
         self.label_ = label
@@ -18,6 +20,8 @@ class _FakeEntity:
 
 
 class _FakeDoc:
+    __slots__ = ("text", "ents")
+
     def __init__(self, text, entities):
         self.text = text
         self.ents = entities
@@ -65,6 +69,19 @@ class TestFormatNamesWithAt:
         assert result.count("@@") == 0
         assert "@Carol" in result
 
+    def test_multiple_names_keep_surrounding_text(self, mock_nlp):
+        from vaani.output import _format_names_with_at
+
+        text = "Ask John, Mary and Google about Priya"
+        mock_nlp.return_value = _FakeDoc(text, [
+            _FakeEntity("John", "PERSON", 4, 8),
+            _FakeEntity("Mary", "PERSON", 10, 14),
+            _FakeEntity("Google", "ORG", 19, 25),
+            _FakeEntity("Priya", "PERSON", 32, 37),
+        ])
+        result = _format_names_with_at(text)
+        assert result == "Ask @John, @Mary and Google about @Priya"
+
     def test_non_person_entities_ignored(self, mock_nlp):
         from vaani.output import _format_names_with_at
 
@@ -82,6 +99,45 @@ class TestFormatNamesWithAt:
         result = _format_names_with_at("Hello John")
         assert result == "Hello John"
 
+    def test_loads_ner_without_unused_pipes(self, monkeypatch):
+        import sys
+        import vaani.output
+
+        fake_spacy = MagicMock()
+        monkeypatch.setitem(sys.modules, "spacy", fake_spacy)
+        monkeypatch.setattr("vaani.output._nlp", None)
+
+        vaani.output._load_nlp()
+
+        fake_spacy.load.assert_called_once()
+        disabled = fake_spacy.load.call_args.kwargs["disable"]
+        assert {"tok2vec", "tagger", "parser", "lemmatizer"} <= set(disabled)
+        assert "ner" not in disabled
+        assert vaani.output._nlp is fake_spacy.load.return_value
+
+    def test_unloaded_model_is_not_loaded_on_paste_path(self, monkeypatch):
+        from vaani.output import _format_names_with_at
+        load = MagicMock()
+        monkeypatch.setattr("vaani.output._nlp", None)
+        monkeypatch.setattr("vaani.output._load_nlp", load)
+        assert _format_names_with_at("Hello John") == "Hello John"
+        load.assert_not_called()
+
+    def test_text_without_capitalized_words_skips_ner(self, mock_nlp):
+        from vaani.output import _format_names_with_at
+        assert _format_names_with_at("ok sounds good, ship it") == "ok sounds good, ship it"
+        mock_nlp.assert_not_called()
+
+    def test_non_ascii_initial_reaches_ner(self, mock_nlp):
+        from vaani.output import _format_names_with_at
+
+        text = "ask Émile and Łukasz"
+        mock_nlp.return_value = _FakeDoc(text, [
+            _FakeEntity("Émile", "PERSON", 4, 9),
+            _FakeEntity("Łukasz", "PERSON", 14, 20),
+        ])
+        assert _format_names_with_at(text) == "ask @Émile and @Łukasz"
+
     def test_exception_returns_original(self, mock_nlp):
         from vaani.output import _format_names_with_at
         mock_nlp.side_effect = RuntimeError("model error")
@@ -97,16 +153,45 @@ class TestClipboard:
     @patch("vaani.output.subprocess.run")
     def test_get_clipboard(self, mock_run):
         from vaani.output import _get_clipboard
-        mock_run.return_value = MagicMock(stdout="clipboard text")
+        mock_run.return_value = MagicMock(stdout="clipboard text\r\n✓".encode())
         result = _get_clipboard()
-        assert result == "clipboard text"
+        assert result == "clipboard text\r\n✓"
 
     @patch("vaani.output.subprocess.run")
     def test_set_clipboard(self, mock_run):
         from vaani.output import _set_clipboard
         _set_clipboard("new text")
         mock_run.assert_called_once()
-        assert mock_run.call_args.kwargs["input"] == "new text"
+        assert mock_run.call_args.kwargs["input"] == b"new text"
+
+
+class TestPasteboard:
+    @pytest.fixture
+    def pasteboard(self, monkeypatch):
+        ns_pasteboard = MagicMock()
+        monkeypatch.setattr("vaani.output._NSPasteboard", ns_pasteboard)
+        monkeypatch.setattr("vaani.output._NSPasteboardTypeString", "public.utf8-plain-text", raising=False)
+        return ns_pasteboard.generalPasteboard.return_value
+
+    @patch("vaani.output.subprocess.run")
+    def test_get_reads_string_without_subprocess(self, mock_run, pasteboard):
+        from vaani.output import _get_clipboard
+        pasteboard.stringForType_.return_value = "clipboard text"
+        assert _get_clipboard() == "clipboard text"
+        mock_run.assert_not_called()
+
+    def test_get_non_text_clipboard_is_empty_string(self, pasteboard):
+        from vaani.output import _get_clipboard
+        pasteboard.stringForType_.return_value = None
+        assert _get_clipboard() == ""
+
+    @patch("vaani.output.subprocess.run")
+    def test_set_replaces_contents_without_subprocess(self, mock_run, pasteboard):
+        from vaani.output import _set_clipboard
+        _set_clipboard("new text")
+        pasteboard.clearContents.assert_called_once()
+        pasteboard.setString_forType_.assert_called_once_with("new text", "public.utf8-plain-text")
+        mock_run.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -114,6 +199,13 @@ class TestClipboard:
 # ---------------------------------------------------------------------------
 
 class TestPasteText:
+    @pytest.fixture(autouse=True)
+    def fresh_keyboard(self):
+        import vaani.output
+        vaani.output._get_keyboard.cache_clear()
+        yield
+        vaani.output._get_keyboard.cache_clear()
+
     @patch("vaani.output.Controller")
     @patch("vaani.output.subprocess.run")
     @patch("vaani.output.time.sleep")
@@ -121,9 +213,57 @@ class TestPasteText:
         from vaani.output import paste_text
 
         mock_nlp.return_value = _FakeDoc("hello", [])
-        mock_run.return_value = MagicMock(stdout="original")
+        mock_run.return_value = MagicMock(stdout=b"original")
 
         paste_text("hello", restore_delay_ms=10)
 
         # Should have called pbpaste (get) and pbcopy (set) multiple times
         assert mock_run.call_count >= 3  # get original + set new + restore
+        mock_sleep.assert_called_once_with(0.01)  # only the restore delay
+
+    @patch("vaani.output.Controller")
+    @patch("vaani.output.subprocess.run")
+    @patch("vaani.output.time.sleep")
+    def test_keyboard_controller_reused_across_pastes(self, mock_sleep, mock_run, mock_ctrl, mock_nlp):
+        from vaani.output import paste_text
+
+        mock_nlp.return_value = _FakeDoc("hello", [])
+        mock_run.return_value = MagicMock(stdout=b"original")
+
+        paste_text("hello", restore_delay_ms=10)
+        paste_text("again", restore_delay_ms=10)
+
+        mock_ctrl.assert_called_once_with()
+        assert mock_ctrl.return_value.tap.call_count == 2
+
+    @patch("vaani.output.Controller")
+    @patch("vaani.output.subprocess.run")
+    @patch("vaani.output.time.sleep")
+    def test_clipboard_already_holding_text_is_left_alone(
+        self, mock_sleep, mock_run, mock_ctrl, mock_nlp
+    ):
+        from vaani.output import paste_text
+
+        mock_nlp.return_value = _FakeDoc("hello", [])
+        mock_run.return_value = MagicMock(stdout=b"hello")
+
+        paste_text("hello", restore_delay_ms=10)
+
+        assert mock_run.call_count == 1  # pbpaste only: no set, no restore
+        mock_ctrl.return_value.tap.assert_called_once_with("v")
+        mock_sleep.assert_not_called()
+
+    @patch("vaani.output.Controller")
+    @patch("vaani.output.subprocess.run")
+    @patch("vaani.output.time.sleep")
+    def test_empty_clipboard_not_restored(self, mock_sleep, mock_run, mock_ctrl, mock_nlp):
+        from vaani.output import paste_text
+
+        mock_nlp.return_value = _FakeDoc("hello", [])
+        mock_run.return_value = MagicMock(stdout=b"")
+
+        paste_text("hello", restore_delay_ms=10)
+
+        assert mock_run.call_count == 2  # pbpaste + pbcopy of the new text
+        assert mock_run.call_args.kwargs["input"] == b"hello"
+        mock_sleep.assert_not_called()
@@ -126,6 +126,16 @@ class TestListeners:
         assert b == [AppState.RECORDING]
 
 
+    def test_listener_added_during_notify_waits_for_next_transition(self):
+        sm = StateMachine()
+        late = []
+        sm.on_change(lambda old, new: sm.on_change(lambda o, n: late.append(n)))
+        sm.transition(AppState.RECORDING)
+        assert late == []
+        sm.transition(AppState.IDLE)
+        assert late == [AppState.IDLE]
+
+
 # ---------------------------------------------------------------------------
 # Full lifecycle
 # ---------------------------------------------------------------------------
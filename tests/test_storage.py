@@ -35,11 +35,70 @@ class TestHistoryStore:
         assert records[1]["raw"] == "first"
 
     def test_limit(self, store):
-        for i in range(5):
-            store.add(f"raw{i}", f"enh{i}", "minimal")
+        store.add_many(
+            {"raw_text": f"raw{i}", "enhanced_text": f"enh{i}", "mode": "minimal"}
+            for i in range(5)
+        )
         records = store.get_recent(limit=3)
         assert len(records) == 3
 
+    def test_wal_journal_mode(self, store):
+        store._ensure_initialized()
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_add_many_single_transaction(self, store):
+        added = store.add_many([
+            {"raw_text": "one", "enhanced_text": "One.", "mode": "minimal"},
+            {"raw_text": "two", "enhanced_text": "Two.", "mode": "casual", "audio_length_secs": 1.5},
+        ])
+        assert added == 2
+        assert not store._conn.in_transaction
+        records = store.get_recent(limit=10)
+        assert [r["raw"] for r in records] == ["two", "one"]
+        assert records[0]["mode"] == "casual"
+        assert records[0]["audio_length_secs"] == 1.5
+
+    def test_add_many_shares_batch_timestamp(self, store):
+        store.add_many([
+            {"raw_text": "one", "enhanced_text": "One.", "mode": "minimal"},
+            {"raw_text": "two", "enhanced_text": "Two.", "mode": "minimal"},
+        ])
+        first, second = store.get_recent()
+        assert first["timestamp"] == second["timestamp"]
+
+    def test_add_commits_without_open_transaction(self, store):
+        store.add("raw", "enh", "minimal")
+        assert not store._conn.in_transaction
+
+    def test_add_many_rolls_back_on_error(self, store):
+        store.add("kept", "kept_e", "minimal")
+        store._conn.execute("CREATE TRIGGER no_funny BEFORE INSERT ON history "
+                            "WHEN NEW.mode = 'funny' BEGIN SELECT RAISE(ABORT, 'nope'); END")
+        with pytest.raises(Exception):
+            store.add_many([
+                {"raw_text": "one", "enhanced_text": "One.", "mode": "minimal"},
+                {"raw_text": "two", "enhanced_text": "Two.", "mode": "funny"},
+            ])
+        assert not store._conn.in_transaction
+        assert [r["raw"] for r in store.get_recent()] == ["kept"]
+
+    def test_add_many_empty(self, store):
+        assert store.add_many([]) == 0
+        assert store.get_recent() == []
+
+    def test_iter_recent_decrypts_lazily(self, store, monkeypatch):
+        for i in range(5):
+            store.add(f"raw{i}", f"enh{i}", "minimal")
+
+        decrypt = store._fernet.decrypt
+        calls = []
+        monkeypatch.setattr(store._fernet, "decrypt", lambda token: calls.append(token) or decrypt(token))
+
+        newest = next(store.iter_recent(limit=5))
+        assert newest["raw"] == "raw4"
+        assert len(calls) == 2  # raw + enhanced of the first row only
+
     def test_encryption_is_real(self, store):
         """Raw DB column should NOT contain plaintext."""
         store.add("secret message", "enhanced secret", "minimal")
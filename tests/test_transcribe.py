@@ -1,62 +1,65 @@
 """Tests for vaani.transcribe — mocked OpenAI Whisper wrapper."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+_WAV = b"fake wav bytes"
+
 
 class TestTranscribe:
+    @pytest.fixture
+    def create(self, mock_keyring):
+        """Patched ``client.audio.transcriptions.create``, with an API key in the keyring."""
+        mock_keyring.set_password("vaani", "openai_api_key", "sk-test")
+        with patch("vaani.transcribe.OpenAI") as mock_openai_cls:
+            yield mock_openai_cls.return_value.audio.transcriptions.create
+
     def test_missing_key_raises_runtime_error(self, mock_keyring):
         from vaani.transcribe import transcribe
         with pytest.raises(RuntimeError, match="OpenAI API key not found"):
-            transcribe(b"fake wav bytes")
+            transcribe(_WAV)
 
-    @patch("vaani.transcribe.OpenAI")
-    def test_correct_api_call(self, mock_openai_cls, mock_keyring):
+    def test_correct_api_call(self, create):
         from vaani.transcribe import transcribe
 
-        mock_keyring.set_password("vaani", "openai_api_key", "sk-test")
-
-        mock_response = MagicMock()
-        mock_response.text = "  Hello world  "
-        mock_client = MagicMock()
-        mock_client.audio.transcriptions.create.return_value = mock_response
-        mock_openai_cls.return_value = mock_client
+        create.return_value.text = "  Hello world  "
 
-        result = transcribe(b"fake wav", model="whisper-1")
+        result = transcribe(_WAV, model="whisper-1")
         assert result == "Hello world"
 
         # Verify the API was called with correct params
-        call_kwargs = mock_client.audio.transcriptions.create.call_args
+        call_kwargs = create.call_args
         assert call_kwargs.kwargs["model"] == "whisper-1"
+        assert call_kwargs.kwargs["file"] == ("recording.wav", _WAV, "audio/wav")
 
-    @patch("vaani.transcribe.OpenAI")
-    def test_uses_default_model(self, mock_openai_cls, mock_keyring):
+    def test_uses_default_model(self, create):
         from vaani.transcribe import transcribe
 
-        mock_keyring.set_password("vaani", "openai_api_key", "sk-test")
+        create.return_value.text = "text"
+
+        transcribe(_WAV)
+        assert create.call_args.kwargs["model"] == "gpt-4o-mini-transcribe"
+
+    def test_strips_whitespace(self, create):
+        from vaani.transcribe import transcribe
 
-        mock_response = MagicMock()
-        mock_response.text = "text"
-        mock_client = MagicMock()
-        mock_client.audio.transcriptions.create.return_value = mock_response
-        mock_openai_cls.return_value = mock_client
+        create.return_value.text = "\n  transcribed text  \n"
 
-        transcribe(b"fake wav")
-        call_kwargs = mock_client.audio.transcriptions.create.call_args
-        assert call_kwargs.kwargs["model"] == "gpt-4o-mini-transcribe"
+        result = transcribe(_WAV)
+        assert result == "transcribed text"
 
     @patch("vaani.transcribe.OpenAI")
-    def test_strips_whitespace(self, mock_openai_cls, mock_keyring):
+    def test_client_reused_until_key_changes(self, mock_openai_cls, mock_keyring):
         from vaani.transcribe import transcribe
 
         mock_keyring.set_password("vaani", "openai_api_key", "sk-test")
+        mock_openai_cls.return_value.audio.transcriptions.create.return_value.text = "text"
 
-        mock_response = MagicMock()
-        mock_response.text = "\n  transcribed text  \n"
-        mock_client = MagicMock()
-        mock_client.audio.transcriptions.create.return_value = mock_response
-        mock_openai_cls.return_value = mock_client
+        transcribe(_WAV)
+        transcribe(_WAV)
+        mock_openai_cls.assert_called_once_with(api_key="sk-test")
 
-        result = transcribe(b"wav")
-        assert result == "transcribed text"
+        mock_keyring.set_password("vaani", "openai_api_key", "sk-new")
+        transcribe(_WAV)
+        assert mock_openai_cls.call_count == 2
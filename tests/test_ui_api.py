@@ -0,0 +1,43 @@
+"""Tests for vaani.ui.api — config handling in the settings window bridge."""
+
+import os
+
+import pytest
+
+pytest.importorskip("objc")
+
+from vaani.config import load_config, save_config
+from vaani.ui.api import VaaniAPI
+
+
+def _edit_externally(config_file, **changes):
+    """Rewrite config.yaml as another process would, with a later mtime."""
+    config = load_config().model_copy(update=changes)
+    save_config(config)
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigCache:
+    def test_save_keeps_external_edit(self, tmp_vaani_dir, monkeypatch):
+        # Out-of-process edits don't bump this process's save generation
+        monkeypatch.setattr("vaani.config.save_generation", lambda: 0)
+        api = VaaniAPI()
+        assert api.save_config({"active_mode": "casual"}) == {"ok": True}
+
+        _edit_externally(tmp_vaani_dir / "config.yaml", hotkey="<cmd>+;")
+
+        assert api.save_config({"sounds_enabled": False}) == {"ok": True}
+        config = load_config()
+        assert config.hotkey == "<cmd>+;"
+        assert config.active_mode == "casual"
+        assert config.sounds_enabled is False
+
+    def test_get_config_reflects_external_edit(self, tmp_vaani_dir, monkeypatch):
+        monkeypatch.setattr("vaani.config.save_generation", lambda: 0)
+        api = VaaniAPI()
+        assert api.get_config()["active_mode"] == "professional"
+
+        _edit_externally(tmp_vaani_dir / "config.yaml", active_mode="code")
+
+        assert api.get_config()["active_mode"] == "code"
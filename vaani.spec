@@ -16,6 +16,7 @@ a = Analysis(
     binaries=[],
     datas=[
         (os.path.join(ROOT, 'src', 'vaani', 'prompts'), os.path.join('vaani', 'prompts')),
+        (os.path.join(ROOT, 'src', 'vaani', 'sounds'), os.path.join('vaani', 'sounds')),
         *([
             (os.path.join(ROOT, 'assets'), 'assets')
         ] if Path(os.path.join(ROOT, 'assets')).exists() else []),